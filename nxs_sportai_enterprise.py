@@ -25,7 +25,13 @@ import time
 import random
 import sqlite3
 import os
-from typing import Dict, List, Optional, Any
+import sys
+import types
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +43,12 @@ try:
 except ImportError:
     PLOTLY_AVAILABLE = False
 
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
 # =============================================================================
 # PLATFORM CONFIGURATION
 # =============================================================================
@@ -65,6 +77,13 @@ class PlatformConfig:
     VERSION = "5.0.0 Enterprise - UNIFIED COMPLETE SUITE"
     COPYRIGHT = "© 2025 NXS Complex Solutions, LLC"
     TRADEMARK = "NXS SportAI Suite Enterprise Edition™"
+    DEMAND_MODEL_PATH = os.getenv("NXS_DEMAND_MODEL_PATH", "nxs_demand_model.npz")
+    # Per-site spec overrides: <SPECS_DIR>/<site>.json, .yaml or .yml
+    SPECS_DIR = os.getenv("NXS_SPECS_DIR", "nxs_specs")
+    DEFAULT_SITE = os.getenv("NXS_SITE", "nxs_national")
+    # Memory budgets for the per-site services one process serves
+    TENANT_MEMORY_BUDGET_MB = int(os.getenv("NXS_TENANT_MEMORY_MB", "256"))
+    MEMORY_BUDGET_MB = int(os.getenv("NXS_MEMORY_MB", "1024"))
     
     FEATURE_MATRIX = {
         LicenseType.STARTER: {
@@ -101,7 +120,17 @@ class NXSComplexSpecifications:
     """Real NXS National Complex specifications and capabilities"""
     
     @staticmethod
-    def get_facility_specs():
+    def get_facility_specs(site: Optional[str] = None) -> 'FrozenDict':
+        """Shared, read-only facility specs for a site (the default site when omitted)"""
+        return NXSSpecRegistry.get(site).facility_specs
+    
+    @staticmethod
+    def get_sponsorship_packages(site: Optional[str] = None) -> 'FrozenDict':
+        """Shared, read-only sponsorship packages for a site (the default site when omitted)"""
+        return NXSSpecRegistry.get(site).sponsorship_packages
+    
+    @staticmethod
+    def builtin_facility_specs():
         """Real NXS National Complex specifications"""
         return {
             "main_dome": {
@@ -138,7 +167,7 @@ class NXSComplexSpecifications:
         }
     
     @staticmethod
-    def get_sponsorship_packages():
+    def builtin_sponsorship_packages():
         """NXS-specific sponsorship packages based on real facility specs"""
         return {
             # TIER 1: NAMING RIGHTS
@@ -224,45 +253,434 @@ class NXSComplexSpecifications:
             }
         }
 
+class FrozenDict(dict):
+    """dict that refuses mutation, so one instance can be shared by every session"""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("NXS specs are read-only; edit the site spec file and reload the registry")
+    
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+    
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into FrozenDicts and lists into tuples"""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def _merge_specs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge_specs(base[key], value) if isinstance(value, dict) and isinstance(base.get(key), dict) else value
+    return merged
+
+@dataclass(frozen=True)
+class NXSSpecs:
+    """One site's frozen specs; version changes whenever any spec value changes"""
+    site: str
+    facility_specs: FrozenDict
+    sponsorship_packages: FrozenDict
+    version: str
+    source: str
+
+class NXSSpecRegistry:
+    """Loads each site's specs once, freezes them and hands out the shared instance
+    
+    A site file may override any part of the built-in specs; nested sections are merged
+    key by key. The file has top-level "facility_specs" and/or "sponsorship_packages" keys.
+    """
+    
+    _sites: Dict[str, NXSSpecs] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get(cls, site: Optional[str] = None) -> NXSSpecs:
+        site = site or PlatformConfig.DEFAULT_SITE
+        specs = cls._sites.get(site)
+        if specs is None:
+            with cls._lock:
+                specs = cls._sites.get(site)
+                if specs is None:
+                    specs = cls._sites[site] = cls._load(site)
+        return specs
+    
+    @classmethod
+    def reload(cls, site: Optional[str] = None) -> NXSSpecs:
+        """Re-read a site's spec file; callers holding the old specs keep a consistent snapshot"""
+        site = site or PlatformConfig.DEFAULT_SITE
+        with cls._lock:
+            specs = cls._sites[site] = cls._load(site)
+        return specs
+    
+    @staticmethod
+    def is_valid_site(site: str) -> bool:
+        return site.isascii() and site.replace('_', '').replace('-', '').isalnum()
+    
+    @classmethod
+    def available_sites(cls) -> List[str]:
+        """The default site plus every site with a spec file"""
+        sites = {PlatformConfig.DEFAULT_SITE}
+        if os.path.isdir(PlatformConfig.SPECS_DIR):
+            for filename in os.listdir(PlatformConfig.SPECS_DIR):
+                site, extension = os.path.splitext(filename)
+                if extension in ('.json', '.yaml', '.yml') and cls.is_valid_site(site):
+                    sites.add(site)
+        return sorted(sites)
+    
+    @classmethod
+    def spec_file(cls, site: str) -> Optional[str]:
+        if not cls.is_valid_site(site):
+            raise ValueError(f"Invalid NXS site name: {site!r}")
+        for extension in ('.json', '.yaml', '.yml'):
+            path = os.path.join(PlatformConfig.SPECS_DIR, site + extension)
+            if os.path.exists(path):
+                return path
+        return None
+    
+    @classmethod
+    def _load(cls, site: str) -> NXSSpecs:
+        raw = {
+            'facility_specs': NXSComplexSpecifications.builtin_facility_specs(),
+            'sponsorship_packages': NXSComplexSpecifications.builtin_sponsorship_packages()
+        }
+        path = cls.spec_file(site)
+        if path is not None:
+            with open(path) as f:
+                if path.endswith('.json'):
+                    override = json.load(f)
+                elif YAML_AVAILABLE:
+                    override = yaml.safe_load(f) or {}
+                else:
+                    raise ImportError(f"PyYAML is required to read {path}")
+            unknown = set(override) - set(raw)
+            if unknown:
+                raise ValueError(f"Unknown sections in {path}: {', '.join(sorted(unknown))}")
+            raw = _merge_specs(raw, override)
+        
+        canonical = json.dumps(raw, sort_keys=True, default=str)
+        return NXSSpecs(
+            site=site,
+            facility_specs=freeze(raw['facility_specs']),
+            sponsorship_packages=freeze(raw['sponsorship_packages']),
+            version=hashlib.sha256(canonical.encode()).hexdigest()[:16],
+            source=path or 'built-in'
+        )
+
 # =============================================================================
 # COMPLETE AI ANALYTICS ENGINE - 10 INTEGRATED MODULES
 # =============================================================================
 
+class AIModuleRegistry(Mapping):
+    """Lazy registry of AI modules: each module is built by its factory on first use"""
+    
+    def __init__(self, factories: Dict[str, Callable[[], Any]], idle_seconds: Optional[float] = None,
+                 sweep_interval: float = 60.0):
+        self._factories = dict(factories)
+        self._modules: Dict[str, Any] = {}
+        self._last_used: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self.idle_seconds = idle_seconds
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
+        self.warmup_seconds: Dict[str, float] = {}
+        self.load_counts: Dict[str, int] = {name: 0 for name in self._factories}
+    
+    def __getitem__(self, name: str):
+        if name not in self._factories:
+            raise KeyError(f"Unknown AI module: {name}")
+        module = self._modules.get(name)
+        if module is None:
+            # Load under the lock so concurrent sessions share a single instance
+            with self._lock:
+                module = self._modules.get(name)
+                if module is None:
+                    start = time.perf_counter()
+                    module = self._factories[name]()
+                    self.warmup_seconds[name] = time.perf_counter() - start
+                    self.load_counts[name] += 1
+                    self._modules[name] = module
+        self._last_used[name] = time.monotonic()
+        self._maybe_sweep()
+        return module
+    
+    def __iter__(self):
+        return iter(self._factories)
+    
+    def __len__(self):
+        return len(self._factories)
+    
+    def is_loaded(self, name: str) -> bool:
+        return name in self._modules
+    
+    def loaded(self) -> List[str]:
+        """Names of the modules currently in memory"""
+        return list(self._modules)
+    
+    def warm(self, *names: str):
+        """Load the named modules (all when none are given) ahead of first use"""
+        for name in names or tuple(self._factories):
+            self[name]
+    
+    def unload(self, name: str) -> bool:
+        """Drop a loaded module; it is rebuilt on next use"""
+        with self._lock:
+            return self._modules.pop(name, None) is not None
+    
+    def unload_idle(self, idle_seconds: Optional[float] = None) -> List[str]:
+        """Unload modules unused for idle_seconds (defaults to the registry setting)"""
+        idle_seconds = self.idle_seconds if idle_seconds is None else idle_seconds
+        if idle_seconds is None:
+            return []
+        cutoff = time.monotonic() - idle_seconds
+        with self._lock:
+            idle = [name for name in self._modules if self._last_used.get(name, 0) < cutoff]
+            for name in idle:
+                del self._modules[name]
+        return idle
+    
+    def _maybe_sweep(self):
+        if self.idle_seconds is None or time.monotonic() - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = time.monotonic()
+        self.unload_idle()
+    
+    def status(self) -> List[Dict[str, Any]]:
+        """Per-module load state, warmup time and idle time"""
+        now = time.monotonic()
+        return [
+            {
+                'module': name,
+                'loaded': name in self._modules,
+                'warmup_ms': round(self.warmup_seconds[name] * 1000, 3) if name in self.warmup_seconds else None,
+                'loads': self.load_counts[name],
+                'idle_s': round(now - self._last_used[name], 1) if name in self._last_used else None
+            }
+            for name in self._factories
+        ]
+
+class ForecastCache:
+    """Memoizes forecasts and insights per (module, facility, horizon, time bucket)
+    
+    Entries expire when the wall clock crosses a bucket boundary, and concurrent
+    requests for a key that is being computed wait for that one computation.
+    """
+    
+    def __init__(self, bucket_minutes: int = 15, max_entries: int = 256):
+        self.bucket_seconds = bucket_minutes * 60
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._current_bucket = None
+        # Bumped by invalidate; a compute that started before an invalidation must not store its result
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._stats: Dict[str, Dict[str, int]] = {}
+    
+    def bucket(self, now: Optional[float] = None) -> int:
+        return int((time.time() if now is None else now) // self.bucket_seconds)
+    
+    def bucket_start(self, bucket: int) -> datetime:
+        return datetime.fromtimestamp(bucket * self.bucket_seconds)
+    
+    def _count(self, module: str, outcome: str):
+        counts = self._stats.setdefault(module, {'hits': 0, 'misses': 0, 'coalesced': 0})
+        counts[outcome] += 1
+    
+    def _expire(self, bucket: int):
+        # Called with the lock held; everything from earlier buckets expires at once
+        if bucket != self._current_bucket:
+            self._current_bucket = bucket
+            for key in [key for key in self._entries if key[3] != bucket]:
+                del self._entries[key]
+    
+    def get_or_compute(self, module: str, compute: Callable[[], Any], facility: str = '*', horizon: Any = 0):
+        """Return the cached value for the current bucket, computing it once if missing"""
+        bucket = self.bucket()
+        key = (module, facility, horizon, bucket)
+        with self._lock:
+            self._expire(bucket)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._count(module, 'hits')
+                return self._entries[key]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                generation = (self._epoch, self._generations.get(module, 0))
+                self._count(module, 'misses')
+            else:
+                self._count(module, 'coalesced')
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            with self._lock:
+                current = (self._epoch, self._generations.get(module, 0))
+                if key[3] == self._current_bucket and current == generation:
+                    self._entries[key] = value
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                # invalidate may already have replaced this compute with a newer one
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+    
+    def invalidate(self, module: Optional[str] = None):
+        """Drop cached entries and in-flight computes for one module, or all of them"""
+        with self._lock:
+            if module is None:
+                self._epoch += 1
+            else:
+                self._generations[module] = self._generations.get(module, 0) + 1
+            for key in [key for key in self._entries if module is None or key[0] == module]:
+                del self._entries[key]
+            # Later callers start a fresh compute instead of waiting on one that uses stale inputs
+            for key in [key for key in self._inflight if module is None or key[0] == module]:
+                del self._inflight[key]
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        """Hits, misses, coalesced waits and hit rate per module"""
+        with self._lock:
+            rows = []
+            for module, counts in sorted(self._stats.items()):
+                requests = counts['hits'] + counts['misses'] + counts['coalesced']
+                rows.append({
+                    'module': module,
+                    **counts,
+                    'hit_rate': round((counts['hits'] + counts['coalesced']) / requests, 3) if requests else 0.0,
+                    'entries': sum(1 for key in self._entries if key[0] == module)
+                })
+            return rows
+    
+    def hit_rate(self) -> float:
+        with self._lock:
+            served = sum(counts['hits'] + counts['coalesced'] for counts in self._stats.values())
+            requests = served + sum(counts['misses'] for counts in self._stats.values())
+        return served / requests if requests else 0.0
+
 class IntegratedAIEngine:
     """Complete AI engine with all 10 modules integrated for NXS Complex"""
     
-    def __init__(self):
-        self.nxs_specs = NXSComplexSpecifications.get_facility_specs()
+    # Modules unused for this long are unloaded and rebuilt on next use
+    MODULE_IDLE_SECONDS = 30 * 60
+    
+    # Facilities shown in demand predictions when there is no data store (NXS National's layout)
+    PREDICTION_FACILITIES = {
+        'Main Dome': 'NXS_DOME_001',
+        'Outdoor Field A': 'NXS_OUTDOOR_001',
+        'Outdoor Field B': 'NXS_OUTDOOR_002',
+        'Basketball Court 1': 'NXS_BBALL_001',
+        'Basketball Court 2': 'NXS_BBALL_002',
+        'Wellness Center': 'NXS_WELLNESS_001',
+        'Esports Arena': 'NXS_ESPORTS_001'
+    }
+    # Facility type -> (prediction label, how many facilities of that type to show)
+    PREDICTION_TYPES = {
+        'Indoor Turf': ('Main Dome', 1),
+        'Outdoor Turf': ('Outdoor Field', 2),
+        'Basketball Court': ('Basketball Court', 2),
+        'Wellness/Fitness': ('Wellness Center', 1),
+        'Gaming/Esports': ('Esports Arena', 1)
+    }
+    
+    def __init__(self, demand_model: Optional['NXSDemandModel'] = None, data_manager: Optional['NXSDataManager'] = None,
+                 site: Optional[str] = None):
+        self.site = site or PlatformConfig.DEFAULT_SITE
+        self.nxs_specs = NXSComplexSpecifications.get_facility_specs(self.site)
+        self.demand_model = demand_model
+        self.data_manager = data_manager
+        self.pricing_optimizer = PricingOptimizer(demand_model) if demand_model is not None else None
         self.models_loaded = False
-        self.ai_modules = {
-            'demand_forecasting': DemandForecaster(),
-            'tournament_matcher': TournamentMatcher(),
-            'nil_compliance': NILComplianceAI(),
-            'wellness_optimizer': WellnessAI(),
-            'revenue_optimizer': RevenueAI(),
-            'predictive_maintenance': PredictiveMaintenanceAI(),
-            'smart_optimization': SmartOptimizationAI(),
-            'esports_manager': EsportsArenaManager(),
-            'biometric_analyzer': BiometricAnalyzer(),
-            'energy_optimizer': EnergyOptimizer()
-        }
+        self.ai_modules = AIModuleRegistry({
+            'demand_forecasting': lambda: DemandForecaster(self.site_facilities()),
+            'tournament_matcher': lambda: TournamentMatcher(self.data_manager),
+            'nil_compliance': NILComplianceAI,
+            'wellness_optimizer': WellnessAI,
+            'revenue_optimizer': lambda: RevenueAI(self.pricing_optimizer),
+            'predictive_maintenance': PredictiveMaintenanceAI,
+            'smart_optimization': SmartOptimizationAI,
+            'esports_manager': EsportsArenaManager,
+            'biometric_analyzer': BiometricAnalyzer,
+            'energy_optimizer': EnergyOptimizer
+        }, idle_seconds=self.MODULE_IDLE_SECONDS)
+        self.forecast_cache = ForecastCache()
+    
+    def site_facilities(self) -> Optional[List[Dict[str, Any]]]:
+        """The site's facility collection, or None without a data store"""
+        return self.data_manager.get_data('nxs_facilities') if self.data_manager is not None else None
+    
+    def prediction_facilities(self) -> Dict[str, str]:
+        """Facilities shown in demand predictions -> data store facility ids, from the site's own facilities"""
+        facilities = self.site_facilities()
+        if facilities is None:
+            return dict(self.PREDICTION_FACILITIES)
+        shown, counts = {}, {}
+        for facility in facilities:
+            if facility['type'] not in self.PREDICTION_TYPES:
+                continue
+            label, limit = self.PREDICTION_TYPES[facility['type']]
+            counts[label] = counts.get(label, 0) + 1
+            if counts[label] <= limit:
+                # Numbered facilities keep their letter or number: Outdoor Turf Field A -> Outdoor Field A
+                name = label if limit == 1 else f"{label} {facility['name'].rsplit(' ', 1)[-1]}"
+                shown[name] = facility['id']
+        return shown
+    
+    def cached(self, module: str, compute: Callable[[], Any], facility: str = '*', horizon: Any = 0):
+        """Shared, time-bucketed result of compute() for every session of the process"""
+        return self.forecast_cache.get_or_compute(module, compute, facility, horizon)
+    
+    def get_demand_predictions(self):
+        """Today's hourly demand predictions, recomputed once per cache bucket"""
+        return self.cached('demand_predictions', self._generate_nxs_demand_predictions, horizon=24)
+    
+    def get_optimizations(self):
+        """Optimization recommendations, recomputed once per cache bucket"""
+        return self.cached('optimizations', self._generate_nxs_optimizations)
+    
+    def get_demand_forecast(self, hours: int, step_minutes: int) -> 'DemandForecast':
+        """All-facility array forecast starting at the current cache bucket"""
+        def compute():
+            start = self.forecast_cache.bucket_start(self.forecast_cache.bucket())
+            return self.ai_modules['demand_forecasting'].forecast(hours=hours, step_minutes=step_minutes, start=start)
+        return self.cached('demand_forecasting', compute, horizon=(hours, step_minutes))
         
     def load_ai_models(self):
-        """Load all AI models for NXS Complex operations"""
+        """Load AI model metadata; predictions and optimizations are computed by the pages that show them"""
         try:
             self.models = {
                 'nxs_demand_forecasting': {
                     'name': 'NXS Complex Demand Forecasting',
                     'accuracy': 0.96,
                     'facilities_covered': ['Main Dome', '4 Outdoor Fields', '4 Basketball Courts', 'Wellness Center'],
-                    'predictions_24h': self._generate_nxs_demand_predictions(),
                     'status': 'active'
                 },
                 'nxs_revenue_optimization': {
                     'name': 'NXS Revenue Optimizer', 
                     'accuracy': 0.93,
                     'annual_revenue_target': 3500000,
-                    'optimizations': self._generate_nxs_optimizations(),
                     'status': 'active'
                 },
                 'nxs_sponsorship_ai': {
@@ -303,7 +721,10 @@ class IntegratedAIEngine:
     
     def _generate_nxs_demand_predictions(self):
         """Generate demand predictions specific to NXS facilities"""
-        facilities = ['Main Dome', 'Outdoor Field A', 'Outdoor Field B', 'Basketball Court 1', 'Basketball Court 2', 'Wellness Center', 'Esports Arena']
+        if self.demand_model is not None:
+            return self._fitted_demand_predictions()
+        
+        facilities = list(self.prediction_facilities())
         predictions = []
         
         for hour in range(24):
@@ -334,6 +755,27 @@ class IntegratedAIEngine:
         
         return predictions
     
+    def _fitted_demand_predictions(self):
+        """Today's hourly predictions from the fitted demand model"""
+        model = self.demand_model
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        shown = self.prediction_facilities()
+        occupancy = model.predict_hours(today, 24, list(shown.values()))
+        predictions = []
+        
+        for hour in range(24):
+            when = today + timedelta(hours=hour)
+            for row, (facility, facility_id) in enumerate(shown.items()):
+                predictions.append({
+                    'hour': hour,
+                    'facility': facility,
+                    'predicted_occupancy': float(occupancy[row, hour]),
+                    'confidence': model.confidence(facility_id, when),
+                    'revenue_potential': float(occupancy[row, hour] * model.hourly_rates[model.index[facility_id], hour])
+                })
+        
+        return predictions
+    
     def _generate_nxs_optimizations(self):
         """Generate optimization recommendations specific to NXS Complex"""
         return [
@@ -386,7 +828,7 @@ class IntegratedAIEngine:
                 'total_occupancy': random.uniform(0.72, 0.89),
                 'revenue_today': random.uniform(12000, 18000),
                 'annual_revenue_pace': 3200000,  # On track for $3.2M annually
-                'highway_35_impressions_today': 45000,
+                'highway_35_impressions_today': self.nxs_specs['annual_metrics']['highway_35_exposure'],
                 'dome_utilization': random.uniform(0.78, 0.92),
                 'outdoor_fields_utilization': random.uniform(0.65, 0.85),
                 'basketball_courts_utilization': random.uniform(0.81, 0.94),
@@ -396,7 +838,7 @@ class IntegratedAIEngine:
                 'parking_occupancy': random.uniform(0.72, 0.91),
                 'energy_efficiency': random.uniform(0.91, 0.97),
                 'member_satisfaction': random.uniform(4.4, 4.9),
-                'ai_recommendations': len(self._generate_nxs_optimizations()),
+                'ai_recommendations': len(self.get_optimizations()),
                 'active_tournaments': random.randint(2, 6),
                 'wellness_alerts': random.randint(0, 4),
                 'maintenance_alerts': random.randint(0, 2),
@@ -432,90 +874,265 @@ class IntegratedAIEngine:
 # AI MODULE CLASSES - ENHANCED FOR NXS COMPLEX
 # =============================================================================
 
+@dataclass(frozen=True)
+class DemandForecast:
+    """Facilities x time forecast; every array is indexed [facility, step]"""
+    facilities: Tuple[str, ...]
+    start: datetime
+    step_minutes: int
+    occupancy: np.ndarray
+    confidence: np.ndarray
+    revenue_potential: np.ndarray
+    
+    @property
+    def steps(self) -> int:
+        return self.occupancy.shape[1]
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        return np.datetime64(self.start, 'm') + np.arange(self.steps) * np.timedelta64(self.step_minutes, 'm')
+    
+    def facility_index(self, facility: str) -> int:
+        return self.facilities.index(facility)
+    
+    def to_frame(self, facilities: Optional[List[str]] = None) -> pd.DataFrame:
+        """Long-format DataFrame (timestamp, facility, occupancy, confidence, revenue_potential)"""
+        rows = [self.facility_index(f) for f in facilities] if facilities else list(range(len(self.facilities)))
+        return pd.DataFrame({
+            'timestamp': np.tile(self.timestamps, len(rows)),
+            'facility': np.repeat(np.array(self.facilities, dtype=object)[rows], self.steps),
+            'predicted_occupancy': self.occupancy[rows].ravel(),
+            'confidence': self.confidence[rows].ravel(),
+            'revenue_potential': self.revenue_potential[rows].ravel()
+        })
+    
+    def to_records(self, facility: str) -> List[Dict[str, Any]]:
+        """Per-step dicts for one facility, in the shape DemandForecaster has always returned"""
+        row = self.facility_index(facility)
+        return [
+            {'hour': step, 'predicted_occupancy': occupancy, 'confidence': confidence, 'revenue_potential': revenue}
+            for step, (occupancy, confidence, revenue) in enumerate(zip(
+                self.occupancy[row].tolist(), self.confidence[row].tolist(), self.revenue_potential[row].tolist()))
+        ]
+
+class DemandForecastEngine:
+    """Vectorized demand forecasting: a facility profile matrix applied to a vector of time steps"""
+    
+    # NXS National's facilities, used when no site facility collection is given
+    FACILITIES = (
+        "Main Dome (1.5 Turf Fields)",
+        "Outdoor Field A", "Outdoor Field B", "Outdoor Field C", "Outdoor Field D",
+        "Basketball Court 1", "Basketball Court 2", "Basketball Court 3", "Basketball Court 4",
+        "Wellness Center", "Esports Arena", "Restaurant", "Conference Rooms"
+    )
+    # Spaces every site has that are not bookable facilities
+    AMENITIES = ("Restaurant", "Conference Rooms")
+    
+    # Facility prefix -> (peak hour windows, inclusive; multiplier; months the peak applies in)
+    DEMAND_PATTERNS = {
+        "Main Dome": ([(6, 9), (17, 21)], 1.4, range(1, 13)),
+        "Outdoor Field": ([(15, 20)], 1.3, range(4, 11)),  # Seasonal outdoor
+        "Basketball": ([(17, 22)], 1.35, range(1, 13)),
+        "Wellness Center": ([(5, 8), (17, 20)], 1.5, range(1, 13)),
+        "Esports Arena": ([(14, 23)], 1.25, range(1, 13))
+    }
+    
+    MAX_HORIZON_HOURS = 90 * 24
+    STEP_MINUTES = (15, 30, 60)
+    # Confidence falls off linearly to this fraction at the maximum horizon
+    HORIZON_CONFIDENCE_FLOOR = 0.8
+    
+    def __init__(self, facilities: Tuple[str, ...] = FACILITIES, patterns: Optional[Tuple[str, ...]] = None):
+        # patterns[i] picks facility i's DEMAND_PATTERNS entry by prefix; the facility name by default
+        self.facilities = tuple(facilities)
+        self.patterns = tuple(patterns) if patterns is not None else self.facilities
+        self.hourly_profile, self.seasonal_months = self._profile_matrix()
+    
+    @classmethod
+    def for_site(cls, facilities: List[Dict[str, Any]]) -> 'DemandForecastEngine':
+        """Engine over a site's facility collection plus its amenities"""
+        patterns = [NXSDemandModel.TYPE_PATTERNS.get(facility['type'], facility['type']) for facility in facilities]
+        return cls(tuple(facility['name'] for facility in facilities) + cls.AMENITIES,
+                   tuple(patterns) + cls.AMENITIES)
+    
+    def _profile_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Peak multipliers per (facility, hour of day) and active months per (facility, month)"""
+        hourly = np.ones((len(self.facilities), 24), dtype=np.float32)
+        months = np.ones((len(self.facilities), 13), dtype=bool)
+        for row, pattern in enumerate(self.patterns):
+            for prefix, (windows, multiplier, active_months) in self.DEMAND_PATTERNS.items():
+                if pattern.startswith(prefix):
+                    for first, last in windows:
+                        hourly[row, first:last + 1] = multiplier
+                    months[row] = np.isin(np.arange(13), list(active_months))
+                    break
+        return hourly, months
+    
+    def forecast(self, hours: int = 24, step_minutes: int = 60, start: Optional[datetime] = None,
+                 seed: Optional[int] = None) -> DemandForecast:
+        """Forecast every facility over the next `hours` at `step_minutes` resolution"""
+        if not 1 <= hours <= self.MAX_HORIZON_HOURS:
+            raise ValueError(f"Forecast horizon must be between 1 and {self.MAX_HORIZON_HOURS} hours")
+        if step_minutes not in self.STEP_MINUTES:
+            raise ValueError(f"Forecast resolution must be one of {self.STEP_MINUTES} minutes")
+        
+        start = start or datetime.now()
+        start = start.replace(minute=start.minute - start.minute % step_minutes, second=0, microsecond=0)
+        steps = hours * 60 // step_minutes
+        
+        times = np.datetime64(start, 'm') + np.arange(steps) * np.timedelta64(step_minutes, 'm')
+        hour_of_day = (times.astype('datetime64[h]') - times.astype('datetime64[D]')).astype(int)
+        month = (times.astype('datetime64[M]').astype(int) % 12) + 1
+        
+        # (facilities x steps) multiplier: the hourly peak where the facility's season is active
+        in_season = self.seasonal_months[:, month]
+        multiplier = np.where(in_season, self.hourly_profile[:, hour_of_day], np.float32(1.0))
+        
+        rng = np.random.default_rng(seed)
+        shape = (len(self.facilities), steps)
+        demand = rng.uniform(0.3, 0.9, shape).astype(np.float32) * multiplier
+        
+        lead = np.arange(steps, dtype=np.float32) * step_minutes / (self.MAX_HORIZON_HOURS * 60)
+        decay = 1.0 - (1.0 - self.HORIZON_CONFIDENCE_FLOOR) * lead
+        confidence = rng.uniform(0.88, 0.98, shape).astype(np.float32) * decay
+        # Revenue potential per step, so it sums to the same total at any resolution
+        revenue = demand * rng.uniform(100, 500, shape).astype(np.float32) * np.float32(step_minutes / 60)
+        
+        return DemandForecast(
+            facilities=self.facilities,
+            start=start,
+            step_minutes=step_minutes,
+            occupancy=np.minimum(demand, 1.0),
+            confidence=confidence,
+            revenue_potential=revenue
+        )
+
 class DemandForecaster:
     """AI-powered demand forecasting specifically for NXS Complex facilities"""
     
+    def __init__(self, facilities: Optional[List[Dict[str, Any]]] = None):
+        # facilities: the site's nxs_facilities collection; NXS National's layout when omitted
+        self.engine = DemandForecastEngine() if facilities is None else DemandForecastEngine.for_site(facilities)
+    
+    def forecast(self, hours: int = 24, step_minutes: int = 60, start: Optional[datetime] = None) -> DemandForecast:
+        """Array forecast for all NXS facilities, up to 90 days at 15-minute resolution"""
+        return self.engine.forecast(hours, step_minutes, start)
+    
     def predict_nxs_demand(self, time_range: int = 24):
         """Predict demand for NXS specific facilities"""
-        nxs_facilities = [
-            "Main Dome (1.5 Turf Fields)",
-            "Outdoor Field A", "Outdoor Field B", "Outdoor Field C", "Outdoor Field D",
-            "Basketball Court 1", "Basketball Court 2", "Basketball Court 3", "Basketball Court 4",
-            "Wellness Center", "Esports Arena", "Restaurant", "Conference Rooms"
-        ]
-        
-        predictions = {}
-        for facility in nxs_facilities:
-            facility_predictions = []
-            for hour in range(time_range):
-                base_demand = random.uniform(0.3, 0.9)
-                
-                # NXS-specific demand patterns
-                if "Main Dome" in facility:
-                    if 6 <= hour <= 9 or 17 <= hour <= 21:
-                        base_demand *= 1.4  # High demand for indoor turf
-                elif "Outdoor Field" in facility:
-                    if 15 <= hour <= 20 and 4 <= datetime.now().month <= 10:  # Seasonal outdoor
-                        base_demand *= 1.3
-                elif "Basketball" in facility:
-                    if 17 <= hour <= 22:  # Evening basketball prime time
-                        base_demand *= 1.35
-                elif facility == "Wellness Center":
-                    if 5 <= hour <= 8 or 17 <= hour <= 20:
-                        base_demand *= 1.5
-                elif facility == "Esports Arena":
-                    if 14 <= hour <= 23:
-                        base_demand *= 1.25
-                
-                facility_predictions.append({
-                    'hour': hour,
-                    'predicted_occupancy': min(base_demand, 1.0),
-                    'confidence': random.uniform(0.88, 0.98),
-                    'revenue_potential': base_demand * random.uniform(100, 500)
-                })
-            
-            predictions[facility] = facility_predictions
-        
-        return predictions
+        forecast = self.engine.forecast(hours=time_range)
+        return {facility: forecast.to_records(facility) for facility in forecast.facilities}
+
+@dataclass(frozen=True)
+class SponsorshipROISurface:
+    """ROI of every sponsorship option at every price point; arrays are indexed [option, price point]"""
+    options: Tuple[str, ...]
+    names: Tuple[str, ...]
+    investments: np.ndarray
+    equivalent_value: float
+    annual_impressions: float
+    roi: np.ndarray
+    roi_low: np.ndarray
+    roi_high: np.ndarray
+    probability_positive: np.ndarray
+    band: Tuple[float, float]
+    uncertainty: float
+    scenarios: int
+    solve_seconds: float
+    
+    def option_index(self, option: str) -> int:
+        return self.options.index(option)
+    
+    @property
+    def payback_months(self) -> np.ndarray:
+        return self.investments / (self.equivalent_value / 12)
+    
+    @property
+    def cost_per_thousand_impressions(self) -> np.ndarray:
+        return self.investments / self.annual_impressions * 1000
+    
+    def to_frame(self, options: Optional[List[str]] = None) -> pd.DataFrame:
+        """Long-format DataFrame, one row per (option, investment)"""
+        rows = [self.option_index(option) for option in options] if options else list(range(len(self.options)))
+        points = self.investments.shape[1]
+        return pd.DataFrame({
+            'option': np.repeat(np.array(self.options, dtype=object)[rows], points),
+            'name': np.repeat(np.array(self.names, dtype=object)[rows], points),
+            'investment': self.investments[rows].ravel(),
+            'roi_percentage': self.roi[rows].ravel().round(1),
+            'roi_low': self.roi_low[rows].ravel().round(1),
+            'roi_high': self.roi_high[rows].ravel().round(1),
+            'probability_positive': self.probability_positive[rows].ravel().round(3),
+            'payback_months': self.payback_months[rows].ravel().round(1),
+            'cpm': self.cost_per_thousand_impressions[rows].ravel().round(2)
+        })
+    
+    def summary(self) -> pd.DataFrame:
+        """Per-option ROI at the bottom and top of its investment range"""
+        return pd.DataFrame({
+            'option': self.options,
+            'name': self.names,
+            'min_investment': self.investments[:, 0],
+            'max_investment': self.investments[:, -1],
+            'roi_at_min': self.roi[:, 0].round(1),
+            'roi_at_max': self.roi[:, -1].round(1),
+            'roi_low_at_max': self.roi_low[:, -1].round(1),
+            'probability_positive_at_max': self.probability_positive[:, -1].round(3)
+        })
 
 class NXSSponsorshipAI:
     """AI-powered sponsorship matching and optimization for NXS Complex"""
     
-    def __init__(self):
-        self.nxs_specs = NXSComplexSpecifications.get_facility_specs()
-        self.sponsorship_packages = NXSComplexSpecifications.get_sponsorship_packages()
+    # Annual cost of buying the same reach as advertising
+    EQUIVALENT_ADVERTISING_COST = {
+        "highway_35_billboards": 180000,  # Premium highway billboard costs
+        "dome_advertising": 120000,  # Equivalent dome-size advertising
+        "digital_advertising": 95000,  # Annual digital ad spend
+        "event_marketing": 140000,  # Tournament and event marketing
+        "pr_value": 200000,  # Public relations and media coverage
+        "sports_media": 85000  # Sports-specific media placement
+    }
+    
+    BUSINESS_BENEFITS = {
+        "brand_association": "Premier 500,000+ visitor sports complex",
+        "community_goodwill": "500,000+ annual positive interactions + Highway 35 exposure",
+        "networking_opportunities": "Corporate events, VIP access, 6 team suites",
+        "employee_benefits": "Full facility access including wellness center",
+        "market_positioning": "Associate with state-of-the-art 90+ foot dome facility"
+    }
+    
+    PREMIUM_FACTORS = [
+        "90+ foot dome unique visibility",
+        "Highway 35 premium exposure (45,000 daily)",
+        "500,000+ annual visitors",
+        "19,500 SF accessory building",
+        "480+ parking spaces"
+    ]
+    
+    def __init__(self, site: Optional[str] = None):
+        self.site = site or PlatformConfig.DEFAULT_SITE
+        self.nxs_specs = NXSComplexSpecifications.get_facility_specs(self.site)
+        self.sponsorship_packages = NXSComplexSpecifications.get_sponsorship_packages(self.site)
+        nxs_metrics = self.nxs_specs['annual_metrics']
+        self.annual_exposure = {
+            "highway_35_visibility": nxs_metrics['highway_35_exposure'] * 365 * 0.025,  # Premium highway exposure
+            "facility_visitors": nxs_metrics['visitors'] * 0.60,  # High engagement rate
+            "dome_visibility": 180000,  # 90+ foot dome visibility
+            "digital_impressions": 2500000,  # Website, app, social media
+            "tournament_exposure": 750000,  # Regional tournament attendees
+            "parking_impressions": 480 * 365 * 8  # 480 spaces daily turnover
+        }
+        self.total_equivalent_value = sum(self.EQUIVALENT_ADVERTISING_COST.values())
     
     def calculate_nxs_sponsorship_roi(self, sponsorship_type: str, investment: int):
         """Calculate ROI specific to NXS Complex specifications"""
-        nxs_metrics = self.nxs_specs['annual_metrics']
-        
         roi_data = {
-            "nxs_annual_exposure": {
-                "highway_35_visibility": nxs_metrics['highway_35_exposure'] * 365 * 0.025,  # Premium highway exposure
-                "facility_visitors": nxs_metrics['visitors'] * 0.60,  # High engagement rate
-                "dome_visibility": 180000,  # 90+ foot dome visibility
-                "digital_impressions": 2500000,  # Website, app, social media
-                "tournament_exposure": 750000,  # Regional tournament attendees
-                "parking_impressions": 480 * 365 * 8  # 480 spaces daily turnover
-            },
-            "nxs_equivalent_advertising_cost": {
-                "highway_35_billboards": 180000,  # Premium highway billboard costs
-                "dome_advertising": 120000,  # Equivalent dome-size advertising
-                "digital_advertising": 95000,  # Annual digital ad spend
-                "event_marketing": 140000,  # Tournament and event marketing
-                "pr_value": 200000,  # Public relations and media coverage
-                "sports_media": 85000  # Sports-specific media placement
-            },
-            "nxs_business_benefits": {
-                "brand_association": "Premier 500,000+ visitor sports complex",
-                "community_goodwill": "500,000+ annual positive interactions + Highway 35 exposure",
-                "networking_opportunities": "Corporate events, VIP access, 6 team suites",
-                "employee_benefits": "Full facility access including wellness center",
-                "market_positioning": "Associate with state-of-the-art 90+ foot dome facility"
-            }
+            "nxs_annual_exposure": dict(self.annual_exposure),
+            "nxs_equivalent_advertising_cost": dict(self.EQUIVALENT_ADVERTISING_COST),
+            "nxs_business_benefits": dict(self.BUSINESS_BENEFITS)
         }
         
-        total_equivalent_value = sum(roi_data["nxs_equivalent_advertising_cost"].values())
+        total_equivalent_value = self.total_equivalent_value
         roi_percentage = ((total_equivalent_value - investment) / investment) * 100
         
         roi_data["nxs_summary"] = {
@@ -523,36 +1140,577 @@ class NXSSponsorshipAI:
             "investment": investment,
             "roi_percentage": roi_percentage,
             "payback_period_months": 12 if roi_percentage > 0 else "N/A",
-            "nxs_premium_factors": [
-                "90+ foot dome unique visibility",
-                "Highway 35 premium exposure (45,000 daily)",
-                "500,000+ annual visitors",
-                "19,500 SF accessory building",
-                "480+ parking spaces"
-            ]
+            "nxs_premium_factors": list(self.PREMIUM_FACTORS)
         }
         
         return roi_data
+    
+    def sponsorship_options(self) -> List[Tuple[str, str, float, float]]:
+        """(option, name, min, max) for every priced tier in the package catalog
+        
+        Packages priced by "investment_range" are one option; packages priced per tier
+        (e.g. full_turf / half_turf) become one option per tier, keyed "package/tier".
+        """
+        options = []
+        for key, package in self.sponsorship_packages.items():
+            for tier, price_range in package.items():
+                if not (isinstance(price_range, (list, tuple)) and len(price_range) == 2
+                        and all(isinstance(price, (int, float)) for price in price_range)):
+                    continue
+                if tier == "investment_range":
+                    options.append((key, package["name"], float(price_range[0]), float(price_range[1])))
+                else:
+                    options.append((f"{key}/{tier}", f"{package['name']} - {tier.replace('_', ' ').title()}",
+                                    float(price_range[0]), float(price_range[1])))
+        return options
+    
+    def evaluate_roi_surface(self, points: int = 21, uncertainty: float = 0.25, band: Tuple[float, float] = (0.1, 0.9),
+                             scenarios: int = 5000, seed: int = 0) -> SponsorshipROISurface:
+        """ROI for every catalog option across its investment range, with sensitivity bands
+        
+        Each advertising-equivalent component varies independently by up to +/- uncertainty
+        across the sampled scenarios. ROI falls monotonically with investment and rises with
+        value, so the bands are the value quantiles pushed through the ROI formula for the
+        whole [option, price point] grid at once.
+        """
+        start = time.perf_counter()
+        catalog = self.sponsorship_options()
+        low = np.array([option[2] for option in catalog])
+        high = np.array([option[3] for option in catalog])
+        investments = low[:, None] + (high - low)[:, None] * np.linspace(0, 1, points)[None]
+        
+        components = np.array(list(self.EQUIVALENT_ADVERTISING_COST.values()), dtype=float)
+        rng = np.random.default_rng(seed)
+        multipliers = rng.uniform(1 - uncertainty, 1 + uncertainty, size=(scenarios, len(components)))
+        values = np.sort(multipliers @ components)
+        value_low, value_high = np.quantile(values, band)
+        
+        def roi(value) -> np.ndarray:
+            return (value - investments) / investments * 100
+        
+        return SponsorshipROISurface(
+            options=tuple(option[0] for option in catalog),
+            names=tuple(option[1] for option in catalog),
+            investments=investments,
+            equivalent_value=self.total_equivalent_value,
+            annual_impressions=sum(self.annual_exposure.values()),
+            roi=roi(self.total_equivalent_value),
+            roi_low=roi(value_low),
+            roi_high=roi(value_high),
+            probability_positive=1 - np.searchsorted(values, investments, side='right') / scenarios,
+            band=band,
+            uncertainty=uncertainty,
+            scenarios=scenarios,
+            solve_seconds=time.perf_counter() - start
+        )
+
+@dataclass
+class TournamentDivision:
+    """One bracket: round-robin pools, then single elimination between pool winners"""
+    name: str
+    sport: str
+    teams: int
+    pool_size: int = 4
+    advance: int = 1
+
+@dataclass
+class TournamentSchedule:
+    """Match assignments plus the quality report of the search that produced them"""
+    matches: List[Dict[str, Any]]
+    unscheduled: List[Dict[str, Any]]
+    quality: Dict[str, Any]
+    
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.matches)
+
+class TournamentScheduler:
+    """Assigns matches to NXS dome fields, outdoor fields and courts over 5-minute time slots
+    
+    Constraints: field suitability per sport, the dome's 1.5-field split (Field 1 hosts one
+    full-size match or two small-sided ones next to Field 1.5), seasonal outdoor fields,
+    existing bookings, team rest time, games per team per day and knockout dependencies.
+    Greedy earliest-slot placement builds a schedule that local search then compacts.
+    """
+    
+    TICK_MINUTES = 5
+    
+    # Sport -> (minutes of play, placement class)
+    SPORTS = {
+        "Soccer 7v7": (50, "small_field"),
+        "Soccer 11v11": (70, "full_field"),
+        "Lacrosse": (70, "full_field"),
+        "Basketball": (40, "court"),
+        "Volleyball": (45, "court_or_half")
+    }
+    SPORT_ALIASES = {"Soccer": "Soccer 11v11"}
+    
+    OUTDOOR_SEASON = range(4, 11)
+    # Indoor turf with room for a full-size match; smaller indoor fields host small-sided play only
+    FULL_FIELD_CAPACITY = 22
+    
+    # Weight of one minute of division makespan against one minute of team idle time
+    MAKESPAN_WEIGHT = 2.0
+    # Cost of leaving a match unscheduled; dominates idle and makespan so the search never trades a match away
+    UNSCHEDULED_PENALTY = 1e6
+    
+    def __init__(self, rest_minutes: int = 60, changeover_minutes: int = 10, max_games_per_day: int = 3,
+                 day_start_hour: int = 8, day_end_hour: int = 22, time_budget: float = 2.0, seed: int = 0,
+                 facilities: Optional[List[Dict[str, Any]]] = None):
+        self.rest = rest_minutes // self.TICK_MINUTES
+        self.changeover = changeover_minutes // self.TICK_MINUTES
+        self.max_games_per_day = max_games_per_day
+        self.day_start_hour = day_start_hour
+        self.day_end_hour = day_end_hour
+        self.time_budget = time_budget
+        self.seed = seed
+        self._build_layout(self.default_facilities() if facilities is None else facilities)
+    
+    @staticmethod
+    def default_facilities(specs: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Schedulable facilities of a site laid out like NXS National, sized from its specs"""
+        specs = specs or NXSComplexSpecifications.get_facility_specs()
+        facilities = [{"id": "NXS_DOME_001", "name": "Main Dome - Field 1", "type": "Indoor Turf", "capacity": 22}]
+        if specs['main_dome']['indoor_turf'] > 1:
+            facilities.append({"id": "NXS_DOME_002", "name": "Main Dome - Field 1.5", "type": "Indoor Turf", "capacity": 11})
+        for i in range(1, specs['outdoor_facilities']['turf_fields'] + 1):
+            facilities.append({"id": f"NXS_OUTDOOR_{i:03d}", "name": f"Outdoor Turf Field {chr(64 + i)}", "type": "Outdoor Turf"})
+        for i in range(1, specs['additional_facilities']['basketball_courts'] + 1):
+            facilities.append({"id": f"NXS_BBALL_{i:03d}", "name": f"Basketball Court {i}", "type": "Basketball Court"})
+        return facilities
+    
+    def _build_layout(self, facilities: List[Dict[str, Any]]):
+        """Resources, booking map and placement preferences from a site's facility list
+        
+        A full-size indoor field splits into two half resources (one full-size match or two
+        small-sided ones); a booking of any facility blocks all of its resources.
+        """
+        self.resources: List[str] = []
+        self.booking_resources: Dict[str, Tuple[int, ...]] = {}
+        full_dome, small_dome, dome_halves, outdoor, courts = [], [], [], [], []
+        
+        def add(facility_id: str, *names: str) -> Tuple[int, ...]:
+            rows = tuple(range(len(self.resources), len(self.resources) + len(names)))
+            self.resources.extend(names)
+            self.booking_resources[facility_id] = rows
+            return rows
+        
+        for facility in sorted(facilities, key=lambda facility: facility["id"]):
+            name = facility["name"]
+            if facility["type"] == "Indoor Turf":
+                if facility.get("capacity", self.FULL_FIELD_CAPACITY) >= self.FULL_FIELD_CAPACITY:
+                    rows = add(facility["id"], f"{name} North Half", f"{name} South Half")
+                    full_dome.append((name, rows))
+                    dome_halves.extend((self.resources[row], (row,)) for row in rows)
+                else:
+                    small_dome.append((name, add(facility["id"], name)))
+            elif facility["type"] == "Outdoor Turf":
+                outdoor.append((name, add(facility["id"], name)))
+            elif facility["type"] == "Basketball Court":
+                courts.append((name, add(facility["id"], name)))
+        
+        self.outdoor_fields = tuple(row for _, rows in outdoor for row in rows)
+        self.courts = tuple(row for _, rows in courts for row in rows)
+        # Full-size fields available in total, counting a small indoor field as half of one
+        self.field_units = len(outdoor) + len(full_dome) + 0.5 * len(small_dome)
+        # Preference order: keep full-size indoor fields whole for full-size matches where possible
+        self.placements = {
+            "full_field": outdoor + full_dome,
+            "small_field": small_dome + outdoor + dome_halves,
+            "court": courts,
+            "court_or_half": small_dome + dome_halves + courts
+        }
+    
+    def _matches(self, divisions: List[TournamentDivision]) -> List[Dict[str, Any]]:
+        """Pool round robins plus knockout brackets; knockout matches depend on their feeders"""
+        matches = []
+        for division in divisions:
+            sport = self.SPORT_ALIASES.get(division.sport, division.sport)
+            if sport not in self.SPORTS:
+                raise ValueError(f"No NXS facility can host {division.sport}")
+            minutes, placement = self.SPORTS[sport]
+            play = -(-minutes // self.TICK_MINUTES)
+            teams = [f"{division.name} T{number:03d}" for number in range(1, division.teams + 1)]
+            pools = [teams[i:i + division.pool_size] for i in range(0, len(teams), division.pool_size)]
+            
+            entries = []
+            for pool_number, pool in enumerate(pools, 1):
+                pool_ids = []
+                # Circle method: every team plays once per round
+                rotation = pool + ([None] if len(pool) % 2 else [])
+                for round_number in range(len(rotation) - 1):
+                    for i in range(len(rotation) // 2):
+                        home, away = rotation[i], rotation[-1 - i]
+                        if home is None or away is None:
+                            continue
+                        match_id = f"{division.name}-P{pool_number}-R{round_number + 1}-{len(pool_ids) + 1}"
+                        matches.append({'id': match_id, 'division': division.name, 'sport': sport,
+                                        'stage': f"Pool {pool_number}", 'order': (0, pool_number, round_number),
+                                        'teams': (home, away), 'play': play, 'placement': placement, 'depends_on': ()})
+                        pool_ids.append(match_id)
+                    rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+                entries.extend([(f"Pool {pool_number} #{rank + 1}", tuple(pool_ids)) for rank in range(min(division.advance, len(pool)))])
+            
+            knockout_round = 0
+            while len(entries) > 1:
+                knockout_round += 1
+                stage = "Final" if len(entries) == 2 else f"Knockout R{knockout_round}"
+                next_entries = []
+                for i in range(0, len(entries) - 1, 2):
+                    (label_a, feeders_a), (label_b, feeders_b) = entries[i], entries[i + 1]
+                    match_id = f"{division.name}-K{knockout_round}-{i // 2 + 1}"
+                    matches.append({'id': match_id, 'division': division.name, 'sport': sport, 'stage': stage,
+                                    'order': (knockout_round, i // 2, 0), 'teams': (), 'slots': (label_a, label_b),
+                                    'play': play, 'placement': placement, 'depends_on': feeders_a + feeders_b})
+                    next_entries.append((f"Winner {match_id}", (match_id,)))
+                if len(entries) % 2:
+                    next_entries.append(entries[-1])  # Bye
+                entries = next_entries
+        return matches
+    
+    def schedule(self, divisions: List[TournamentDivision], start: datetime, days: int = 2,
+                 bookings: Optional[List[Dict[str, Any]]] = None) -> TournamentSchedule:
+        """Schedule every division from start's date over `days` days"""
+        solve_start = time.perf_counter()
+        matches = self._matches(divisions)
+        division_pool_sizes = {division.name: division.pool_size for division in divisions}
+        index = {match['id']: i for i, match in enumerate(matches)}
+        first_day = datetime.combine(start.date(), datetime.min.time())
+        ticks_per_day = (self.day_end_hour - self.day_start_hour) * 60 // self.TICK_MINUTES
+        total_ticks = ticks_per_day * days
+        day_of_tick = np.arange(total_ticks) // ticks_per_day
+        
+        def tick_time(tick: int) -> datetime:
+            return first_day + timedelta(days=int(tick // ticks_per_day), hours=self.day_start_hour,
+                                         minutes=int(tick % ticks_per_day) * self.TICK_MINUTES)
+        
+        # Resource occupancy: blocked by bookings, out-of-season outdoor fields and scheduled matches
+        resource_busy = np.zeros((len(self.resources), total_ticks), dtype=np.int32)
+        for day in range(days):
+            if (first_day + timedelta(days=day)).month not in self.OUTDOOR_SEASON:
+                resource_busy[list(self.outdoor_fields), day * ticks_per_day:(day + 1) * ticks_per_day] += 1
+        for booking in bookings or []:
+            resources = self.booking_resources.get(booking.get("facility_id"))
+            if not resources or booking.get("status") == "Cancelled":
+                continue
+            booking_start = datetime.strptime(booking["start_time"], "%Y-%m-%d %H:%M")
+            booking_end = datetime.strptime(booking["end_time"], "%Y-%m-%d %H:%M")
+            for day in range(days):
+                day_open = first_day + timedelta(days=day, hours=self.day_start_hour)
+                first = max(0, int((booking_start - day_open).total_seconds() // 60 // self.TICK_MINUTES))
+                last = min(ticks_per_day, -int(-(booking_end - day_open).total_seconds() // 60 // self.TICK_MINUTES))
+                if first < last:
+                    resource_busy[list(resources), day * ticks_per_day + first:day * ticks_per_day + last] += 1
+        
+        available = resource_busy == 0
+        team_names = sorted({team for match in matches for team in match['teams']})
+        team_index = {team: i for i, team in enumerate(team_names)}
+        team_busy = np.zeros((len(team_names), total_ticks), dtype=np.int32)
+        team_games = np.zeros((len(team_names), days), dtype=np.int32)
+        dependents = {i: [] for i in range(len(matches))}
+        for i, match in enumerate(matches):
+            match['team_rows'] = [team_index[team] for team in match['teams']]
+            match['deps'] = [index[dep] for dep in match['depends_on']]
+            for dep in match['deps']:
+                dependents[dep].append(i)
+        
+        starts = np.full(len(matches), -1)
+        placed: List[Optional[Tuple[str, Tuple[int, ...]]]] = [None] * len(matches)
+        
+        def occupy(i: int, start_tick: int, placement: Tuple[str, Tuple[int, ...]], sign: int):
+            match = matches[i]
+            resource_busy[list(placement[1]), start_tick:start_tick + match['play'] + self.changeover] += sign
+            for row in match['team_rows']:
+                team_busy[row, start_tick:start_tick + match['play']] += sign
+                team_games[row, day_of_tick[start_tick]] += sign
+            starts[i] = start_tick if sign > 0 else -1
+            placed[i] = placement if sign > 0 else None
+        
+        def window_clear(busy: np.ndarray, length: int, before: int = 0) -> np.ndarray:
+            """Start ticks s where busy is all zero over [s - before, s + length)"""
+            cumulative = np.concatenate(([0], np.cumsum(busy > 0)))
+            s = np.arange(total_ticks)
+            lo = np.clip(s - before, 0, total_ticks)
+            hi = np.clip(s + length, 0, total_ticks)
+            return (cumulative[hi] - cumulative[lo] == 0) & (s + length <= total_ticks)
+        
+        def feasible(i: int) -> List[Tuple[Tuple[str, Tuple[int, ...]], np.ndarray]]:
+            """Feasible start-tick mask per placement for match i, given every other placed match"""
+            match = matches[i]
+            occupied = match['play'] + self.changeover
+            s = np.arange(total_ticks)
+            mask = day_of_tick == day_of_tick[np.minimum(s + occupied - 1, total_ticks - 1)]
+            mask &= s + occupied <= total_ticks
+            
+            earliest = 0
+            for dep in match['deps']:
+                if starts[dep] < 0:
+                    return []
+                earliest = max(earliest, starts[dep] + matches[dep]['play'] + self.rest)
+            latest = total_ticks
+            for dependent in dependents[i]:
+                if starts[dependent] >= 0:
+                    latest = min(latest, starts[dependent] - self.rest - match['play'])
+            mask &= (s >= earliest) & (s <= latest)
+            
+            for row in match['team_rows']:
+                mask &= window_clear(team_busy[row], match['play'] + self.rest, before=self.rest)
+                mask &= team_games[row, day_of_tick] < self.max_games_per_day
+            if not mask.any():
+                return []
+            
+            options = []
+            for placement in self.placements[match['placement']]:
+                placement_mask = mask.copy()
+                for resource in placement[1]:
+                    placement_mask &= window_clear(resource_busy[resource], occupied)
+                if placement_mask.any():
+                    options.append((placement, placement_mask))
+            return options
+        
+        def team_span(row: int, excluding: int) -> Tuple[Optional[int], Optional[int], int]:
+            first, last, played = None, None, 0
+            for j in team_matches[row]:
+                if j != excluding and starts[j] >= 0:
+                    first = starts[j] if first is None else min(first, starts[j])
+                    end = starts[j] + matches[j]['play']
+                    last = end if last is None else max(last, end)
+                    played += matches[j]['play']
+            return first, last, played
+        
+        def schedule_cost() -> float:
+            """Idle and makespan minutes of the matches placed so far"""
+            idle = 0
+            for row in range(len(team_names)):
+                first, last, played = team_span(row, -1)
+                if first is not None:
+                    idle += last - first - played
+            division_ends = {}
+            for i, match in enumerate(matches):
+                if starts[i] >= 0:
+                    division_ends[match['division']] = max(division_ends.get(match['division'], 0), starts[i] + match['play'])
+            return (idle + self.MAKESPAN_WEIGHT * sum(division_ends.values())) * self.TICK_MINUTES
+        
+        def objective() -> float:
+            return schedule_cost() + int((starts < 0).sum()) * self.UNSCHEDULED_PENALTY
+        
+        def placement_cost(i: int, mask: np.ndarray) -> np.ndarray:
+            """Objective contribution of match i at every start tick (infinite where infeasible)"""
+            match = matches[i]
+            s = np.arange(total_ticks)
+            end = s + match['play']
+            cost = np.zeros(total_ticks)
+            for row in match['team_rows']:
+                first, last, _ = team_span(row, i)
+                if first is not None:
+                    cost += np.maximum(last, end) - np.minimum(first, s)
+            division_end = max((starts[j] + matches[j]['play'] for j in range(len(matches))
+                                if j != i and starts[j] >= 0 and matches[j]['division'] == match['division']), default=0)
+            cost += self.MAKESPAN_WEIGHT * np.maximum(division_end, end)
+            return np.where(mask, cost, np.inf)
+        
+        team_matches = {row: [] for row in range(len(team_names))}
+        for i, match in enumerate(matches):
+            for row in match['team_rows']:
+                team_matches[row].append(i)
+        
+        # Greedy: pools go in blocks of two waves that fill the venues able to host them, round by round
+        # within a block, so one wave plays while the other rests; each knockout match follows the block of
+        # its last feeding pool. Every match takes its earliest feasible start.
+        block = {}
+        for i, match in enumerate(matches):
+            if match['deps']:
+                block[i] = max(block[dep] for dep in match['deps'])
+            else:
+                pool_size = division_pool_sizes[match['division']]
+                pools_per_block = max(1, 2 * len(self.placements[match['placement']]) // max(1, pool_size // 2))
+                block[i] = (match['order'][1] - 1) // pools_per_block
+        order = sorted(range(len(matches)), key=lambda i: (block[i], matches[i]['order'][0], matches[i]['order'][2],
+                                                           len(self.placements[matches[i]['placement']]), matches[i]['order'][1]))
+        for i in order:
+            best = None
+            for placement, mask in feasible(i):
+                start_tick = int(np.argmax(mask))
+                if best is None or start_tick < best[0]:
+                    best = (start_tick, placement)
+            if best is not None:
+                occupy(i, best[0], best[1], +1)
+        greedy_objective = schedule_cost()
+        
+        # Local search (ruin and recreate): lift a team's matches or everything in a time window, reinsert
+        # them together with any unscheduled matches at their cheapest feasible slots, keep the result when
+        # the objective does not get worse
+        position = {i: k for k, i in enumerate(order)}
+        rng = random.Random(self.seed)
+        iterations = moves = 0
+        current_objective = objective()
+        deadline = time.perf_counter() + self.time_budget
+        while time.perf_counter() < deadline and iterations < 50 * len(matches):
+            iterations += 1
+            if rng.random() < 0.5:
+                row = rng.randrange(len(team_names))
+                lifted = {j for j in team_matches[row] if starts[j] >= 0}
+            else:
+                tick = rng.randrange(total_ticks)
+                lifted = {j for j in np.flatnonzero((starts >= tick) & (starts < tick + 2 * self.rest))}
+                lifted = set(rng.sample(sorted(lifted), min(len(lifted), 8)))
+            lifted |= set(np.flatnonzero(starts < 0).tolist())
+            saved = [(j, int(starts[j]), placed[j]) for j in lifted if starts[j] >= 0]
+            for j, start_tick, placement in saved:
+                occupy(j, start_tick, placement, -1)
+            
+            for j in sorted(lifted, key=position.get):
+                best = None
+                for placement, mask in feasible(j):
+                    costs = placement_cost(j, mask)
+                    tick = int(np.argmin(costs))
+                    if best is None or costs[tick] < best[0]:
+                        best = (costs[tick], tick, placement)
+                if best is not None:
+                    occupy(j, best[1], best[2], +1)
+            
+            candidate = objective()
+            if candidate <= current_objective:
+                if candidate < current_objective or any(starts[j] != start_tick or placed[j] != placement
+                                                        for j, start_tick, placement in saved):
+                    moves += 1
+                current_objective = candidate
+                continue
+            for j in lifted:
+                if starts[j] >= 0:
+                    occupy(j, int(starts[j]), placed[j], -1)
+            for j, start_tick, placement in saved:
+                occupy(j, start_tick, placement, +1)
+        final_objective = schedule_cost()
+        
+        scheduled, unscheduled = [], []
+        for i, match in enumerate(matches):
+            row = {
+                'match_id': match['id'],
+                'division': match['division'],
+                'sport': match['sport'],
+                'stage': match['stage'],
+                'home': match['teams'][0] if match['teams'] else match['slots'][0],
+                'away': match['teams'][1] if match['teams'] else match['slots'][1]
+            }
+            if starts[i] < 0:
+                unscheduled.append(row)
+                continue
+            row.update({
+                'venue': placed[i][0],
+                'start': tick_time(starts[i]),
+                'end': tick_time(starts[i] + match['play'])
+            })
+            scheduled.append(row)
+        scheduled.sort(key=lambda row: (row['start'], row['venue']))
+        
+        return TournamentSchedule(
+            matches=scheduled,
+            unscheduled=unscheduled,
+            quality=self._quality(matches, starts, team_names, team_matches, resource_busy, available, total_ticks,
+                                  greedy_objective, final_objective, iterations, moves, time.perf_counter() - solve_start)
+        )
+    
+    def _quality(self, matches, starts, team_names, team_matches, resource_busy, available, total_ticks,
+                 greedy_objective, final_objective, iterations, moves, solve_seconds) -> Dict[str, Any]:
+        """How good the schedule is: coverage, team idle time, and makespan against a lower bound"""
+        scheduled = starts >= 0
+        idle = []
+        for row in range(len(team_names)):
+            own = [j for j in team_matches[row] if starts[j] >= 0]
+            if own:
+                span = max(starts[j] + matches[j]['play'] for j in own) - min(starts[j] for j in own)
+                idle.append((span - sum(matches[j]['play'] for j in own)) * self.TICK_MINUTES)
+        
+        makespan = max((starts[i] + matches[i]['play'] for i in range(len(matches)) if scheduled[i]), default=0)
+        # Lower bound: longest dependency chain, or total work over the venues able to host it
+        chain = {}
+        for i, match in enumerate(matches):
+            chain[i] = max((chain[dep] + self.rest for dep in match['deps']), default=0) + match['play']
+        work = {'court': 0.0, 'field': 0.0}
+        for match in matches:
+            occupied = match['play'] + self.changeover
+            if match['placement'] == 'court':
+                work['court'] += occupied
+            elif match['placement'] == 'full_field':
+                work['field'] += occupied
+            elif match['placement'] == 'small_field':
+                work['field'] += occupied / 2  # Half of Field 1 at best
+        lower_bound = max(max(chain.values(), default=0),
+                          work['court'] / len(self.courts) if self.courts else 0,
+                          work['field'] / self.field_units if self.field_units else 0)
+        
+        concurrency = 0
+        if scheduled.any():
+            playing = np.zeros(total_ticks, dtype=np.int32)
+            for i in np.flatnonzero(scheduled):
+                playing[starts[i]:starts[i] + matches[i]['play']] += 1
+            concurrency = int(playing.max())
+        
+        return {
+            'matches_total': len(matches),
+            'matches_scheduled': int(scheduled.sum()),
+            'teams': len(team_names),
+            'max_concurrent_matches': concurrency,
+            'avg_team_idle_minutes': round(float(np.mean(idle)), 1) if idle else 0.0,
+            'max_team_idle_minutes': int(max(idle, default=0)),
+            'makespan_minutes': int(makespan * self.TICK_MINUTES),
+            'lower_bound_minutes': int(np.ceil(lower_bound) * self.TICK_MINUTES),
+            # Only meaningful once every match is placed: a partial schedule can finish before the bound
+            'gap_to_lower_bound': (round(float(makespan / np.ceil(lower_bound) - 1), 3)
+                                   if lower_bound and scheduled.all() else None),
+            # Share of open venue time (not booked, not out of season) taken by matches and changeovers
+            'venue_utilization': round(float((resource_busy > 0)[available].mean()), 3) if available.any() else 0.0,
+            'objective_greedy': round(float(greedy_objective), 1),
+            'objective_final': round(float(final_objective), 1),
+            'local_search_improvement': round(float(1 - final_objective / greedy_objective), 3) if greedy_objective else 0.0,
+            'local_search_iterations': iterations,
+            'local_search_moves': moves,
+            'solve_seconds': round(solve_seconds, 2)
+        }
 
 class TournamentMatcher:
     """AI tournament management optimized for NXS Complex capabilities"""
     
+    def __init__(self, data_manager: Optional['NXSDataManager'] = None, time_budget: float = 2.0):
+        self.data_manager = data_manager
+        # The site's own venues: fields and courts come from its facility collection
+        facilities = data_manager.get_data("nxs_facilities") if data_manager is not None else None
+        self.scheduler = TournamentScheduler(time_budget=time_budget, facilities=facilities)
+    
+    def schedule_divisions(self, divisions: List[TournamentDivision], start: datetime, days: int = 2) -> TournamentSchedule:
+        """Schedule divisions around the bookings already in the NXS data store"""
+        bookings = self.data_manager.get_data("nxs_bookings") if self.data_manager is not None else []
+        return self.scheduler.schedule(divisions, start, days, bookings)
+    
     def optimize_nxs_tournament_schedule(self, tournament_id: str):
         """Optimize tournament scheduling using NXS Complex specifications"""
-        nxs_specs = NXSComplexSpecifications.get_facility_specs()
+        if self.data_manager is None:
+            raise ValueError("Tournament scheduling needs the NXS data manager")
+        tournament = next((t for t in self.data_manager.get_data("nxs_tournaments") if t["id"] == tournament_id), None)
+        if tournament is None:
+            raise ValueError(f"Unknown NXS tournament {tournament_id}")
+        
+        start = datetime.strptime(tournament["start_date"], "%Y-%m-%d")
+        days = (datetime.strptime(tournament["end_date"], "%Y-%m-%d") - start).days + 1
+        division = TournamentDivision(tournament["name"], tournament["sport"], tournament["teams"])
+        result = self.schedule_divisions([division], start, days)
+        quality = result.quality
+        frame = result.to_frame()
         
         return {
             'tournament_id': tournament_id,
             'nxs_optimized_schedule': {
                 'main_dome_capacity': '1.5 turf fields simultaneous',
-                'outdoor_fields_available': nxs_specs['outdoor_facilities']['turf_fields'],
-                'basketball_courts_available': nxs_specs['additional_facilities']['basketball_courts'],
-                'total_concurrent_games': 8,  # Max simultaneous across all facilities
-                'facility_utilization': 0.91,
-                'estimated_duration': '2-3 days for major tournaments',
-                'optimal_start_times': ['8:00 AM', '12:00 PM', '4:00 PM', '7:00 PM'],
+                'venues_used': sorted(frame['venue'].unique()) if not frame.empty else [],
+                'total_concurrent_games': quality['max_concurrent_matches'],
+                'facility_utilization': quality['venue_utilization'],
+                'estimated_duration': f"{quality['makespan_minutes'] / 60:.1f} playing hours over {days} days",
+                'optimal_start_times': [start.strftime('%I:%M %p') for start in sorted({match['start'].time() for match in result.matches})[:4]],
                 'dome_height_advantage': '90+ feet allows for any indoor sport'
             },
+            'schedule': [{**match, 'start': match['start'].isoformat(), 'end': match['end'].isoformat()} for match in result.matches],
+            'unscheduled': result.unscheduled,
+            'quality': quality,
             'nxs_revenue_optimization': {
                 'dynamic_pricing': True,
                 'dome_premium_multiplier': 1.6,  # Premium for unique dome facility
@@ -570,6 +1728,64 @@ class TournamentMatcher:
             }
         }
 
+class NILComplianceAI:
+    """NIL (Name, Image, Likeness) compliance AI system for NXS Complex"""
+    
+    def analyze_nil_deals(self):
+        """Analyze NIL deals for compliance at NXS Complex"""
+        return {
+            'active_deals': [
+                {
+                    'athlete': 'Jordan Thompson',
+                    'sport': 'Soccer',
+                    'deal_value': 12000,
+                    'sponsor': 'Local Athletic Store',
+                    'compliance_status': 'Approved',
+                    'risk_score': 0.12,
+                    'facility_usage': 'Main Dome + Outdoor Fields'
+                },
+                {
+                    'athlete': 'Alex Rivera',
+                    'sport': 'Basketball',
+                    'deal_value': 8500,
+                    'sponsor': 'Sports Gear Co',
+                    'compliance_status': 'Under Review',
+                    'risk_score': 0.38,
+                    'facility_usage': 'Basketball Courts 1-2'
+                },
+                {
+                    'athlete': 'Casey Kim',
+                    'sport': 'Esports',
+                    'deal_value': 5500,
+                    'sponsor': 'Gaming Hardware Corp',
+                    'compliance_status': 'Approved',
+                    'risk_score': 0.15,
+                    'facility_usage': 'Esports Arena'
+                }
+            ],
+            'compliance_alerts': [
+                {
+                    'type': 'documentation',
+                    'athlete': 'Alex Rivera',
+                    'message': 'Missing required disclosure form for basketball sponsorship',
+                    'urgency': 'medium',
+                    'facility_impact': 'Basketball Courts usage affected'
+                }
+            ],
+            'market_insights': {
+                'avg_deal_value': 8667,
+                'trending_categories': ['Athletic Apparel', 'Gaming Equipment', 'Local Business'],
+                'compliance_rate': 0.91,
+                'nxs_facility_correlation': 'Athletes using premium facilities command higher NIL values'
+            },
+            'nxs_specific_metrics': {
+                'dome_athlete_deals': 2,
+                'basketball_athlete_deals': 1,
+                'esports_athlete_deals': 1,
+                'avg_deal_premium': '23% higher for multi-facility access athletes'
+            }
+        }
+
 class EsportsArenaManager:
     """Enhanced esports management for NXS Complex esports arena"""
     
@@ -972,38 +2188,196 @@ class EnergyOptimizer:
             }
         }
 
+@dataclass(frozen=True)
+class PricingPlan:
+    """Revenue-maximizing hourly prices for one week; arrays are indexed [facility, hour of week]"""
+    facility_ids: Tuple[str, ...]
+    facility_types: Tuple[str, ...]
+    week_start: datetime
+    base_prices: np.ndarray
+    prices: np.ndarray
+    expected_occupancy: np.ndarray
+    expected_revenue: np.ndarray
+    baseline_revenue: np.ndarray
+    solve_seconds: float
+    
+    def summary(self) -> pd.DataFrame:
+        """Per-facility current vs optimized average rate and weekly revenue"""
+        baseline = self.baseline_revenue.sum(axis=1)
+        optimized = self.expected_revenue.sum(axis=1)
+        return pd.DataFrame({
+            'facility_id': self.facility_ids,
+            'type': self.facility_types,
+            'current_avg_rate': self.base_prices.mean(axis=1).round(2),
+            'optimized_avg_rate': self.prices.mean(axis=1).round(2),
+            'min_rate': self.prices.min(axis=1),
+            'max_rate': self.prices.max(axis=1),
+            'weekly_revenue_current': baseline.round(0),
+            'weekly_revenue_optimized': optimized.round(0),
+            'revenue_uplift': np.where(baseline > 0, optimized / np.where(baseline > 0, baseline, 1) - 1, 0.0).round(3)
+        })
+    
+    def schedule(self, facility_id: str) -> pd.DataFrame:
+        """Hour-by-hour prices for one facility over the week"""
+        row = self.facility_ids.index(facility_id)
+        return pd.DataFrame({
+            'current_rate': self.base_prices[row],
+            'optimized_rate': self.prices[row],
+            'expected_occupancy': self.expected_occupancy[row]
+        }, index=pd.date_range(self.week_start, periods=self.prices.shape[1], freq='h'))
+
+class PricingOptimizer:
+    """Solves for revenue-maximizing hourly prices from forecast demand and price elasticity
+    
+    Demand at a candidate price p follows a linear response around the current rate p0:
+    occupancy = forecast * (1 - elasticity * (p / p0 - 1)), capped at capacity. Every
+    candidate price on the grid is evaluated for all facility-hours at once.
+    """
+    
+    # Price elasticity of demand per facility type at the current rate
+    ELASTICITY = {
+        "Indoor Turf": 0.6,
+        "Outdoor Turf": 0.9,
+        "Basketball Court": 1.1,
+        "Wellness/Fitness": 1.3,
+        "Gaming/Esports": 1.5
+    }
+    DEFAULT_ELASTICITY = 1.0
+    # Prime-time customers are less price sensitive
+    PRIME_ELASTICITY_FACTOR = 0.8
+    
+    def __init__(self, demand_model: 'NXSDemandModel', elasticity: Optional[Dict[str, float]] = None,
+                 min_multiplier: float = 0.7, max_multiplier: float = 1.5, grid_points: int = 81,
+                 weeks_cached: int = 8):
+        self.demand_model = demand_model
+        self.elasticity = {**self.ELASTICITY, **(elasticity or {})}
+        self.price_grid = np.linspace(min_multiplier, max_multiplier, grid_points)
+        self.weeks_cached = weeks_cached
+        self._plans: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def week_start(when: Optional[datetime] = None) -> datetime:
+        when = when or datetime.now()
+        return (when - timedelta(days=when.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    def optimize(self, week_start: Optional[datetime] = None) -> PricingPlan:
+        """Plan for the week containing week_start, re-solved when the demand model has new days"""
+        week_start = self.week_start(week_start)
+        key = (week_start, self.demand_model.revision)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                plan = self._plans[key] = self._solve(week_start)
+                while len(self._plans) > self.weeks_cached:
+                    self._plans.popitem(last=False)
+            return plan
+    
+    def invalidate(self):
+        with self._lock:
+            self._plans.clear()
+    
+    def _solve(self, week_start: datetime) -> PricingPlan:
+        start = time.perf_counter()
+        model = self.demand_model
+        hours = np.arange(NXSDemandModel.HOURS_PER_WEEK)
+        
+        base_prices = model.hourly_rates[:, hours % 24]
+        forecast = model.predict_hours(week_start, len(hours))
+        prime = np.isin(hours % 24, list(NXSDemandModel.PRIME_HOURS))
+        elasticity = np.array([self.elasticity.get(facility_type, self.DEFAULT_ELASTICITY)
+                               for facility_type in model.facility_types])[:, None]
+        elasticity = elasticity * np.where(prime, self.PRIME_ELASTICITY_FACTOR, 1.0)
+        
+        # (grid, facilities, hours): every candidate price for every facility-hour
+        candidates = np.round(base_prices[None] * self.price_grid[:, None, None])
+        safe_base = np.where(base_prices > 0, base_prices, 1)[None]
+        occupancy = np.clip(forecast[None] * (1 - elasticity[None] * (candidates / safe_base - 1)), 0, 1)
+        revenue = candidates * occupancy
+        
+        best = revenue.argmax(axis=0)[None]
+        prices = np.take_along_axis(candidates, best, axis=0)[0]
+        return PricingPlan(
+            facility_ids=model.facility_ids,
+            facility_types=model.facility_types,
+            week_start=week_start,
+            base_prices=base_prices,
+            prices=np.where(base_prices > 0, prices, base_prices),
+            expected_occupancy=np.take_along_axis(occupancy, best, axis=0)[0],
+            expected_revenue=np.take_along_axis(revenue, best, axis=0)[0],
+            baseline_revenue=base_prices * np.minimum(forecast, 1),
+            solve_seconds=time.perf_counter() - start
+        )
+
 class RevenueAI:
     """Advanced revenue optimization for NXS Complex"""
     
+    # Used when no fitted demand model is available
+    STATIC_PRICING = {
+        'main_dome': {
+            'current_rate': 180,  # Premium rate for unique dome facility
+            'optimal_rate': 215,
+            'expected_increase': '+19%',
+            'justification': '90+ foot dome is unique regional asset'
+        },
+        'outdoor_fields': {
+            'current_rate': 120,
+            'optimal_rate': 145,
+            'expected_increase': '+21%',
+            'justification': '4 fields allow tournament hosting'
+        },
+        'basketball_courts': {
+            'current_rate': 85,
+            'optimal_rate': 95,
+            'expected_increase': '+12%',
+            'justification': '4 courts provide premium scheduling flexibility'
+        },
+        'wellness_center': {
+            'current_rate': 35,
+            'optimal_rate': 42,
+            'expected_increase': '+20%',
+            'justification': '3,500 SF dedicated wellness space'
+        }
+    }
+    
+    # Facility type -> (pricing class, justification) reported by optimize_nxs_pricing
+    PRICING_CLASSES = {
+        "Indoor Turf": ('main_dome', '90+ foot dome is unique regional asset'),
+        "Outdoor Turf": ('outdoor_fields', '4 fields allow tournament hosting'),
+        "Basketball Court": ('basketball_courts', '4 courts provide premium scheduling flexibility'),
+        "Wellness/Fitness": ('wellness_center', '3,500 SF dedicated wellness space'),
+        "Gaming/Esports": ('esports_arena', 'Pro gaming rigs with tournament streaming')
+    }
+    
+    def __init__(self, pricing_optimizer: Optional[PricingOptimizer] = None):
+        self.pricing_optimizer = pricing_optimizer
+    
+    def _dynamic_pricing(self):
+        """Current vs optimized prime-time rate and revenue uplift per pricing class for this week"""
+        if self.pricing_optimizer is None:
+            return self.STATIC_PRICING
+        
+        plan = self.pricing_optimizer.optimize()
+        prime = np.isin(np.arange(plan.prices.shape[1]) % 24, list(NXSDemandModel.PRIME_HOURS))
+        pricing = {}
+        for facility_type, (pricing_class, justification) in self.PRICING_CLASSES.items():
+            rows = [row for row, row_type in enumerate(plan.facility_types) if row_type == facility_type]
+            if not rows:
+                continue
+            baseline = plan.baseline_revenue[rows].sum()
+            optimized = plan.expected_revenue[rows].sum()
+            pricing[pricing_class] = {
+                'current_rate': int(round(plan.base_prices[rows][:, prime].mean())),
+                'optimal_rate': int(round(plan.prices[rows][:, prime].mean())),
+                'expected_increase': f"{optimized / baseline - 1:+.0%}" if baseline > 0 else '+0%',
+                'justification': justification
+            }
+        return pricing
+    
     def optimize_nxs_pricing(self):
         """Revenue optimization specific to NXS Complex facilities"""
         return {
-            'nxs_dynamic_pricing': {
-                'main_dome': {
-                    'current_rate': 180,  # Premium rate for unique dome facility
-                    'optimal_rate': 215,
-                    'expected_increase': '+19%',
-                    'justification': '90+ foot dome is unique regional asset'
-                },
-                'outdoor_fields': {
-                    'current_rate': 120,
-                    'optimal_rate': 145,
-                    'expected_increase': '+21%',
-                    'justification': '4 fields allow tournament hosting'
-                },
-                'basketball_courts': {
-                    'current_rate': 85,
-                    'optimal_rate': 95,
-                    'expected_increase': '+12%',
-                    'justification': '4 courts provide premium scheduling flexibility'
-                },
-                'wellness_center': {
-                    'current_rate': 35,
-                    'optimal_rate': 42,
-                    'expected_increase': '+20%',
-                    'justification': '3,500 SF dedicated wellness space'
-                }
-            },
+            'nxs_dynamic_pricing': self._dynamic_pricing(),
             'nxs_demand_insights': {
                 'dome_peak_times': ['6 PM - 9 PM weekdays', '10 AM - 4 PM weekends'],
                 'outdoor_seasonal': 'April-October premium pricing (+30%)',
@@ -1053,23 +2427,39 @@ class RevenueAI:
 class NXSDataManager:
     """Enhanced data management system for NXS Complex operations"""
     
-    def __init__(self):
-        self.nxs_specs = NXSComplexSpecifications.get_facility_specs()
+    def __init__(self, site: Optional[str] = None):
+        self.site = site or PlatformConfig.DEFAULT_SITE
+        self.nxs_specs = NXSComplexSpecifications.get_facility_specs(self.site)
         self.data_store = self._initialize_nxs_data_store()
     
     def _initialize_nxs_data_store(self):
         """Initialize data store with NXS-specific data"""
+        return {collection: builder() for collection, builder in self._collection_builders().items()}
+    
+    def _collection_builders(self):
+        """Builder for each data store collection"""
         return {
-            "nxs_facilities": self._get_nxs_facilities(),
-            "nxs_members": self._get_nxs_members(),
-            "nxs_bookings": self._get_nxs_bookings(),
-            "nxs_tournaments": self._get_nxs_tournaments(),
-            "nxs_sponsorships": self._get_nxs_sponsorships(),
-            "nxs_staff": self._get_nxs_staff(),
-            "nxs_maintenance": self._get_nxs_maintenance(),
-            "nxs_revenue": self._get_nxs_revenue_data()
+            "nxs_facilities": self._get_nxs_facilities,
+            "nxs_members": self._get_nxs_members,
+            "nxs_bookings": self._get_nxs_bookings,
+            "nxs_tournaments": self._get_nxs_tournaments,
+            "nxs_sponsorships": self._get_nxs_sponsorships,
+            "nxs_staff": self._get_nxs_staff,
+            "nxs_maintenance": self._get_nxs_maintenance,
+            "nxs_revenue": self._get_nxs_revenue_data
         }
     
+    def refresh(self, *collections: str):
+        """Rebuild the named collections, or all of them when none are given"""
+        builders = self._collection_builders()
+        unknown = set(collections) - set(builders)
+        if unknown:
+            raise KeyError(f"Unknown NXS collections: {', '.join(sorted(unknown))}")
+        
+        rebuilt = {collection: builders[collection]() for collection in (collections or builders)}
+        # Swap in a new dict so sessions reading concurrently never see a half-refreshed store
+        self.data_store = {**self.data_store, **rebuilt}
+    
     def _get_nxs_facilities(self):
         """Get NXS Complex facilities based on real specifications"""
         facilities = []
@@ -1101,8 +2491,8 @@ class NXSDataManager:
             "unique_features": ["Shared dome space", "Training focused"]
         })
         
-        # 4 Outdoor Turf Fields
-        for i in range(1, 5):
+        # Outdoor Turf Fields (4 at NXS National)
+        for i in range(1, self.nxs_specs['outdoor_facilities']['turf_fields'] + 1):
             facilities.append({
                 "id": f"NXS_OUTDOOR_{i:03d}",
                 "name": f"Outdoor Turf Field {chr(64+i)}",  # A, B, C, D
@@ -1116,8 +2506,8 @@ class NXSDataManager:
                 "unique_features": ["Natural lighting", "Tournament capable"]
             })
         
-        # 4 Basketball Courts
-        for i in range(1, 5):
+        # Basketball Courts (4 at NXS National)
+        for i in range(1, self.nxs_specs['additional_facilities']['basketball_courts'] + 1):
             facilities.append({
                 "id": f"NXS_BBALL_{i:03d}",
                 "name": f"Basketball Court {i}",
@@ -1193,10 +2583,711 @@ class NXSDataManager:
             }
         ]
     
+    def _get_nxs_bookings(self):
+        """Get NXS Complex booking data"""
+        current_time = datetime.now()
+        bookings = []
+        
+        facility_ids = [facility["id"] for facility in self._get_nxs_facilities()]
+        
+        for i in range(50):  # Generate 50 sample bookings
+            start_time = current_time + timedelta(days=random.randint(-2, 7), hours=random.randint(6, 21))
+            duration = random.choice([1, 1.5, 2, 2.5, 3])
+            
+            bookings.append({
+                "id": f"NXS_BK{i+1:03d}",
+                "facility_id": random.choice(facility_ids),
+                "start_time": start_time.strftime("%Y-%m-%d %H:%M"),
+                "end_time": (start_time + timedelta(hours=duration)).strftime("%Y-%m-%d %H:%M"),
+                "duration": duration,
+                "activity_type": random.choice(["Soccer Training", "Basketball Game", "Lacrosse Practice", "Wellness Session", "Tournament", "League Game", "Open Play", "Esports Tournament"]),
+                "organizer": random.choice(["NXS Youth League", "Adult League", "High School", "Private Coach", "Corporate Event", "Tournament Organizer"]),
+                "participants": random.randint(8, 40),
+                "status": random.choice(["Confirmed", "Confirmed", "Confirmed", "Pending", "Cancelled"]),
+                "revenue": random.randint(80, 400),
+                "member_id": random.choice(["NXS_M001", "NXS_M002", "NXS_M003", None])
+            })
+        
+        return bookings
+    
+    def _get_nxs_tournaments(self):
+        """Get NXS Complex tournament data"""
+        return [
+            {
+                "id": "NXS_T001",
+                "name": "NXS Regional Soccer Championship",
+                "sport": "Soccer",
+                "teams": 16,
+                "start_date": "2024-03-15",
+                "end_date": "2024-03-17",
+                "status": "Confirmed",
+                "facilities_used": ["NXS_DOME_001", "NXS_OUTDOOR_001", "NXS_OUTDOOR_002"],
+                "prize_pool": 15000,
+                "entry_fee": 250,
+                "expected_attendance": 2500,
+                "revenue_projection": 45000
+            },
+            {
+                "id": "NXS_T002",
+                "name": "Youth Basketball League Finals",
+                "sport": "Basketball", 
+                "teams": 12,
+                "start_date": "2024-04-05",
+                "end_date": "2024-04-07",
+                "status": "Planning",
+                "facilities_used": ["NXS_BBALL_001", "NXS_BBALL_002", "NXS_BBALL_003"],
+                "prize_pool": 8000,
+                "entry_fee": 150,
+                "expected_attendance": 1200,
+                "revenue_projection": 25000
+            },
+            {
+                "id": "NXS_T003",
+                "name": "Esports Championship Series",
+                "sport": "Esports",
+                "teams": 32,
+                "start_date": "2024-04-20",
+                "end_date": "2024-04-21",
+                "status": "Open Registration",
+                "facilities_used": ["NXS_ESPORTS_001"],
+                "prize_pool": 12000,
+                "entry_fee": 75,
+                "expected_attendance": 500,
+                "revenue_projection": 18000
+            }
+        ]
+    
+    def _get_nxs_sponsorships(self):
+        """Get NXS Complex sponsorship data"""
+        return [
+            {
+                "id": "NXS_S001",
+                "sponsor_name": "TechCorp Solutions",
+                "sponsorship_type": "Main Dome Naming Rights",
+                "annual_value": 750000,
+                "contract_start": "2024-01-01",
+                "contract_end": "2029-12-31",
+                "status": "Active",
+                "benefits": ["Dome naming rights", "Premium signage", "VIP access", "Corporate events"],
+                "contact_person": "Sarah Mitchell",
+                "contact_email": "sarah.mitchell@techcorp.com"
+            },
+            {
+                "id": "NXS_S002",
+                "sponsor_name": "Athletic Gear Pro",
+                "sponsorship_type": "Basketball Courts Package",
+                "annual_value": 180000,
+                "contract_start": "2024-01-01", 
+                "contract_end": "2026-12-31",
+                "status": "Active",
+                "benefits": ["4 courts naming", "Equipment supply", "Team uniforms"],
+                "contact_person": "Mike Johnson",
+                "contact_email": "mike.johnson@athleticgear.com"
+            },
+            {
+                "id": "NXS_S003",
+                "sponsor_name": "Wellness First Healthcare",
+                "sponsorship_type": "Wellness Center Sponsorship",
+                "annual_value": 125000,
+                "contract_start": "2024-02-01",
+                "contract_end": "2027-01-31",
+                "status": "Active",
+                "benefits": ["Wellness center naming", "Health programs", "Nutrition counseling"],
+                "contact_person": "Dr. Lisa Chen",
+                "contact_email": "lisa.chen@wellnessfirst.com"
+            }
+        ]
+    
+    def _get_nxs_staff(self):
+        """Get NXS Complex staff data"""
+        return [
+            {
+                "id": "NXS_ST001",
+                "name": "Jennifer Park",
+                "position": "Facility Director",
+                "department": "Administration",
+                "hire_date": "2023-01-15",
+                "certifications": ["Sports Management", "CPR/AED"],
+                "facilities_managed": ["All"],
+                "contact": "jennifer.park@nxs.com"
+            },
+            {
+                "id": "NXS_ST002",
+                "name": "Carlos Rodriguez",
+                "position": "Dome Operations Manager",
+                "department": "Dome Operations",
+                "hire_date": "2023-03-01",
+                "certifications": ["HVAC Systems", "Safety Management"],
+                "facilities_managed": ["NXS_DOME_001", "NXS_DOME_002"],
+                "contact": "carlos.rodriguez@nxs.com"
+            },
+            {
+                "id": "NXS_ST003",
+                "name": "Amanda Foster",
+                "position": "Basketball Program Coordinator",
+                "department": "Sports Programs",
+                "hire_date": "2023-05-10",
+                "certifications": ["Basketball Coaching", "Youth Development"],
+                "facilities_managed": ["NXS_BBALL_001", "NXS_BBALL_002", "NXS_BBALL_003", "NXS_BBALL_004"],
+                "contact": "amanda.foster@nxs.com"
+            }
+        ]
+    
+    def _get_nxs_maintenance(self):
+        """Get NXS Complex maintenance data"""
+        return [
+            {
+                "id": "NXS_M001",
+                "facility_id": "NXS_DOME_001",
+                "equipment": "HVAC System - Main Dome",
+                "maintenance_type": "Preventive",
+                "scheduled_date": "2024-03-25",
+                "status": "Scheduled",
+                "priority": "High",
+                "estimated_cost": 1200,
+                "description": "Quarterly HVAC inspection and filter replacement"
+            },
+            {
+                "id": "NXS_M002",
+                "facility_id": "NXS_BBALL_003",
+                "equipment": "Basketball Court Flooring",
+                "maintenance_type": "Repair",
+                "scheduled_date": "2024-03-20",
+                "status": "In Progress",
+                "priority": "Medium",
+                "estimated_cost": 800,
+                "description": "Minor scuff repair and refinishing"
+            },
+            {
+                "id": "NXS_M003",
+                "facility_id": "NXS_OUTDOOR_002",
+                "equipment": "Turf Field Irrigation",
+                "maintenance_type": "Upgrade",
+                "scheduled_date": "2024-04-01",
+                "status": "Planned",
+                "priority": "Medium",
+                "estimated_cost": 2500,
+                "description": "Sprinkler system upgrade and calibration"
+            }
+        ]
+    
+    def _get_nxs_revenue_data(self):
+        """Get NXS Complex revenue data"""
+        current_date = datetime.now()
+        revenue_data = []
+        
+        # Generate daily revenue data for the past 30 days
+        for i in range(30):
+            date = current_date - timedelta(days=i)
+            
+            # Base revenue with realistic patterns
+            base_revenue = random.uniform(12000, 18000)
+            
+            # Weekend bonus
+            if date.weekday() >= 5:  # Saturday/Sunday
+                base_revenue *= 1.3
+            
+            # Seasonal adjustments
+            if date.month in [6, 7, 8]:  # Summer
+                base_revenue *= 1.2
+            
+            revenue_data.append({
+                "date": date.strftime("%Y-%m-%d"),
+                "total_revenue": base_revenue,
+                "dome_revenue": base_revenue * 0.28,
+                "outdoor_fields_revenue": base_revenue * 0.22,
+                "basketball_revenue": base_revenue * 0.18,
+                "wellness_revenue": base_revenue * 0.12,
+                "esports_revenue": base_revenue * 0.08,
+                "restaurant_revenue": base_revenue * 0.08,
+                "parking_revenue": base_revenue * 0.04
+            })
+        
+        return revenue_data
+    
     def get_data(self, collection: str):
         """Get data from NXS data store"""
         return self.data_store.get(collection, [])
 
+# =============================================================================
+# DEMAND MODEL - SEASONAL PROFILES FITTED ON BOOKING AND REVENUE HISTORY
+# =============================================================================
+
+class NXSDemandModel:
+    """Per-facility hour-of-week occupancy and month revenue profiles fitted by exponential smoothing
+    
+    Profiles start from the DemandForecastEngine patterns and fold in history one day at a
+    time, so new days are added incrementally. Prediction is array indexing only.
+    """
+    
+    HOURS_PER_WEEK = 168
+    PRIME_HOURS = range(17, 22)
+    PRIOR_OCCUPANCY = 0.6
+    
+    # Facility type -> DemandForecastEngine pattern used as the prior hour-of-week profile
+    TYPE_PATTERNS = {
+        "Indoor Turf": "Main Dome",
+        "Outdoor Turf": "Outdoor Field",
+        "Basketball Court": "Basketball",
+        "Wellness/Fitness": "Wellness Center",
+        "Gaming/Esports": "Esports Arena"
+    }
+    
+    # Facility type -> revenue history column shared by facilities of that type
+    TYPE_REVENUE = {
+        "Indoor Turf": "dome_revenue",
+        "Outdoor Turf": "outdoor_fields_revenue",
+        "Basketball Court": "basketball_revenue",
+        "Wellness/Fitness": "wellness_revenue",
+        "Gaming/Esports": "esports_revenue"
+    }
+    
+    def __init__(self, facilities: List[Dict[str, Any]], alpha: float = 0.3, month_alpha: float = 0.1):
+        self.facility_ids = tuple(facility["id"] for facility in facilities)
+        self.facility_types = tuple(facility.get("type", "") for facility in facilities)
+        self.alpha = alpha
+        self.month_alpha = month_alpha
+        self.hourly_rates = np.array([
+            [facility.get("hourly_rate_prime", 0) if hour in self.PRIME_HOURS else facility.get("hourly_rate_nonprime", 0)
+             for hour in range(24)]
+            for facility in facilities
+        ], dtype=np.float64)
+        self.hour_of_week = self._prior_profile()
+        self.observations = np.zeros((len(facilities), self.HOURS_PER_WEEK), dtype=np.int32)
+        self.month_revenue = np.zeros((len(facilities), 12))
+        self.month_days = np.zeros((len(facilities), 12), dtype=np.int32)
+        self.last_observed: Optional[datetime] = None
+        self.revision = 0
+        self._lock = threading.Lock()
+        self._index_facilities()
+    
+    def _index_facilities(self):
+        self.index = {facility_id: row for row, facility_id in enumerate(self.facility_ids)}
+        self.month_factors = self._month_factors(self.month_revenue, self.month_days)
+    
+    def _prior_profile(self) -> np.ndarray:
+        patterns = [self.TYPE_PATTERNS.get(facility_type, facility_type) for facility_type in self.facility_types]
+        multipliers = DemandForecastEngine(tuple(patterns)).hourly_profile
+        return np.tile(np.minimum(self.PRIOR_OCCUPANCY * multipliers, 1.0), 7).astype(np.float64)
+    
+    @staticmethod
+    def _month_factors(month_revenue: np.ndarray, month_days: np.ndarray) -> np.ndarray:
+        """Observed month revenue relative to the facility's average observed month; 1.0 where unobserved"""
+        observed = month_days > 0
+        counts = np.maximum(observed.sum(axis=1, keepdims=True), 1)
+        mean = np.where(observed, month_revenue, 0).sum(axis=1, keepdims=True) / counts
+        return np.where(observed & (mean > 0), month_revenue / np.where(mean > 0, mean, 1), 1.0)
+    
+    def _booked_fractions(self, bookings: List[Dict[str, Any]]) -> Dict[Any, np.ndarray]:
+        """Fraction of each (facility, hour) booked, per day; cancelled bookings are ignored"""
+        days: Dict[Any, np.ndarray] = {}
+        for booking in bookings:
+            row = self.index.get(booking.get("facility_id"))
+            if row is None or booking.get("status") == "Cancelled":
+                continue
+            start = datetime.strptime(booking["start_time"], "%Y-%m-%d %H:%M")
+            end = start + timedelta(hours=float(booking["duration"]))
+            moment = start
+            while moment < end:
+                hour_end = moment.replace(minute=0) + timedelta(hours=1)
+                grid = days.setdefault(moment.date(), np.zeros((len(self.facility_ids), 24)))
+                grid[row, moment.hour] += (min(end, hour_end) - moment).total_seconds() / 3600
+                moment = hour_end
+        return {day: np.minimum(grid, 1.0) for day, grid in days.items()}
+    
+    def _daily_revenue(self, record: Dict[str, Any]) -> np.ndarray:
+        """Split each area's revenue evenly across the facilities of that type"""
+        type_counts = {facility_type: self.facility_types.count(facility_type) for facility_type in set(self.facility_types)}
+        return np.array([
+            record.get(self.TYPE_REVENUE.get(facility_type, ""), 0.0) / type_counts[facility_type]
+            for facility_type in self.facility_types
+        ])
+    
+    def fit(self, bookings: List[Dict[str, Any]], revenue: List[Dict[str, Any]], through: Optional[datetime] = None) -> int:
+        """Refit from the priors over the whole history; returns the number of days folded in"""
+        with self._lock:
+            self.hour_of_week = self._prior_profile()
+            self.observations[:] = 0
+            self.month_revenue[:] = 0
+            self.month_days[:] = 0
+            self.last_observed = None
+            self.revision += 1
+        return self.update(bookings, revenue, through)
+    
+    def update(self, bookings: List[Dict[str, Any]], revenue: List[Dict[str, Any]], through: Optional[datetime] = None) -> int:
+        """Fold in the finished days after the last observed day, before `through` (default today)
+        
+        Occupancy is only learned for days inside the span the booking history covers (first to
+        last booking date); days outside it with just a revenue record update month revenue alone.
+        """
+        through = (through or datetime.now()).date()
+        booked = self._booked_fractions(bookings)
+        booking_span = (min(booked), max(booked)) if booked else None
+        revenue_by_day = {datetime.strptime(record["date"], "%Y-%m-%d").date(): record for record in revenue}
+        
+        with self._lock:
+            after = self.last_observed.date() if self.last_observed else None
+            days = sorted(day for day in set(booked) | set(revenue_by_day) if day < through and (after is None or day > after))
+            if not days:
+                return 0
+            
+            # Update copies and swap them in, so concurrent predictions never see a half-folded day
+            hour_of_week = self.hour_of_week.copy()
+            observations = self.observations.copy()
+            month_revenue = self.month_revenue.copy()
+            month_days = self.month_days.copy()
+            idle = np.zeros((len(self.facility_ids), 24))
+            for day in days:
+                if booking_span and booking_span[0] <= day <= booking_span[1]:
+                    slots = day.weekday() * 24 + np.arange(24)
+                    hour_of_week[:, slots] += self.alpha * (booked.get(day, idle) - hour_of_week[:, slots])
+                    observations[:, slots] += 1
+                if day in revenue_by_day:
+                    month = day.month - 1
+                    daily = self._daily_revenue(revenue_by_day[day])
+                    first = month_days[:, month] == 0
+                    month_revenue[:, month] = np.where(
+                        first, daily, month_revenue[:, month] + self.month_alpha * (daily - month_revenue[:, month]))
+                    month_days[:, month] += 1
+            
+            self.hour_of_week = hour_of_week
+            self.observations = observations
+            self.month_revenue = month_revenue
+            self.month_days = month_days
+            self.month_factors = self._month_factors(month_revenue, month_days)
+            self.last_observed = datetime.combine(days[-1], datetime.min.time())
+            self.revision += 1
+        return len(days)
+    
+    def update_from(self, data_manager: 'NXSDataManager', path: Optional[str] = None) -> int:
+        """Fold in new days from the data store and persist the parameters when anything changed"""
+        days = self.update(data_manager.get_data("nxs_bookings"), data_manager.get_data("nxs_revenue"))
+        if days and path:
+            self.save(path)
+        return days
+    
+    def predict(self, facility_id: str, when: datetime) -> float:
+        """Expected occupancy of one facility-hour"""
+        row = self.index[facility_id]
+        occupancy = self.hour_of_week[row, when.weekday() * 24 + when.hour] * self.month_factors[row, when.month - 1]
+        return min(float(occupancy), 1.0)
+    
+    def predict_hours(self, start: datetime, hours: int, facility_ids: Optional[List[str]] = None) -> np.ndarray:
+        """Expected occupancy as a (facilities, hours) array starting at start's hour"""
+        rows = [self.index[facility_id] for facility_id in facility_ids] if facility_ids else slice(None)
+        start = start.replace(minute=0, second=0, microsecond=0)
+        times = np.datetime64(start, 'h') + np.arange(hours)
+        weekday = (times.astype('datetime64[D]').astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        hour = (times - times.astype('datetime64[D]')).astype(np.int64)
+        month = times.astype('datetime64[M]').astype(np.int64) % 12
+        occupancy = self.hour_of_week[rows][:, weekday * 24 + hour] * self.month_factors[rows][:, month]
+        return np.minimum(occupancy, 1.0)
+    
+    def confidence(self, facility_id: str, when: datetime) -> float:
+        """Grows from 0.75 towards 0.95 as the hour-of-week slot accumulates observations"""
+        observations = self.observations[self.index[facility_id], when.weekday() * 24 + when.hour]
+        return 0.75 + 0.2 * (1 - float(np.exp(-observations / 4)))
+    
+    def save(self, path: str):
+        """Persist fitted parameters; written to a temp file first so readers never see a partial file"""
+        temp_path = f"{path}.tmp"
+        with self._lock, open(temp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                facility_ids=np.array(self.facility_ids),
+                facility_types=np.array(self.facility_types),
+                hourly_rates=self.hourly_rates,
+                hour_of_week=self.hour_of_week,
+                observations=self.observations,
+                month_revenue=self.month_revenue,
+                month_days=self.month_days,
+                smoothing=np.array([self.alpha, self.month_alpha]),
+                last_observed=np.array(self.last_observed.isoformat() if self.last_observed else "")
+            )
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> 'NXSDemandModel':
+        with np.load(path, allow_pickle=False) as state:
+            model = cls.__new__(cls)
+            model.facility_ids = tuple(state["facility_ids"].tolist())
+            model.facility_types = tuple(state["facility_types"].tolist())
+            model.hourly_rates = state["hourly_rates"]
+            model.hour_of_week = state["hour_of_week"]
+            model.observations = state["observations"]
+            model.month_revenue = state["month_revenue"]
+            model.month_days = state["month_days"]
+            model.alpha, model.month_alpha = state["smoothing"].tolist()
+            last_observed = str(state["last_observed"])
+        model.last_observed = datetime.fromisoformat(last_observed) if last_observed else None
+        model.revision = 0
+        model._lock = threading.Lock()
+        model._index_facilities()
+        return model
+    
+    @classmethod
+    def load_or_fit(cls, path: Optional[str], data_manager: 'NXSDataManager') -> 'NXSDemandModel':
+        """Resume from persisted parameters when they match the facility list, then fold in new days"""
+        facilities = data_manager.get_data("nxs_facilities")
+        model = None
+        if path and os.path.exists(path):
+            try:
+                model = cls.load(path)
+            except (OSError, ValueError, KeyError):
+                model = None  # Unreadable parameters are refitted from history
+            if model is not None and model.facility_ids != tuple(facility["id"] for facility in facilities):
+                model = None
+        if model is None:
+            model = cls(facilities)
+        model.update_from(data_manager, path)
+        return model
+
+# =============================================================================
+# SERVICE LIFECYCLE - SHARED SERVICES PER PROCESS, USER STATE PER SESSION
+# =============================================================================
+
+@dataclass
+class NXSServices:
+    """Read-mostly services for one site, shared by every session viewing that site"""
+    site: str
+    nxs_specs: Dict[str, Any]
+    spec_version: str
+    data_manager: NXSDataManager
+    demand_model: NXSDemandModel
+    ai_engine: IntegratedAIEngine
+    sponsorship_ai: NXSSponsorshipAI
+    built_at: datetime
+    build_seconds: float
+
+def demand_model_path(site: str) -> str:
+    """The default site keeps DEMAND_MODEL_PATH; other sites get <stem>_<site><ext> beside it"""
+    if site == PlatformConfig.DEFAULT_SITE:
+        return PlatformConfig.DEMAND_MODEL_PATH
+    stem, extension = os.path.splitext(PlatformConfig.DEMAND_MODEL_PATH)
+    return f"{stem}_{site}{extension}"
+
+def _build_nxs_services(site: str) -> NXSServices:
+    """Build one site's services from that site's specs, data and demand model"""
+    start = time.perf_counter()
+    specs = NXSSpecRegistry.get(site)
+    data_manager = NXSDataManager(site)
+    demand_model = NXSDemandModel.load_or_fit(demand_model_path(site), data_manager)
+    ai_engine = IntegratedAIEngine(demand_model=demand_model, data_manager=data_manager, site=site)
+    sponsorship_ai = NXSSponsorshipAI(site)
+    return NXSServices(
+        site=site,
+        nxs_specs=specs.facility_specs,
+        spec_version=specs.version,
+        data_manager=data_manager,
+        demand_model=demand_model,
+        ai_engine=ai_engine,
+        sponsorship_ai=sponsorship_ai,
+        built_at=datetime.now(),
+        build_seconds=time.perf_counter() - start
+    )
+
+def estimate_memory(root: Any) -> int:
+    """Approximate bytes reachable from root, counting numpy buffers and DataFrames in full"""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, np.ndarray):
+            total += obj.nbytes
+        elif isinstance(obj, pd.DataFrame):
+            total += int(obj.memory_usage(deep=True).sum())
+        elif isinstance(obj, pd.Series):
+            total += int(obj.memory_usage(deep=True))
+        elif isinstance(obj, (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+            continue  # Code and classes are shared by every tenant
+        else:
+            total += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+            elif hasattr(obj, '__dict__'):
+                stack.append(vars(obj))
+    return total
+
+class NXSTenantPool:
+    """Per-site services with a memory budget per tenant and one across all tenants
+    
+    A tenant over its budget first unloads its AI modules, then drops its forecast and
+    pricing caches; its data store and demand model always stay. When the tenants together
+    exceed the process budget, tenants still over their own budget are evicted first, then
+    the least recently used ones; evicted tenants rebuild on their next request, so one
+    large site cannot starve the rest.
+    """
+    
+    def __init__(self, tenant_budget_bytes: int, total_budget_bytes: int, check_interval: float = 30.0):
+        self.tenant_budget_bytes = tenant_budget_bytes
+        self.total_budget_bytes = total_budget_bytes
+        self.check_interval = check_interval
+        self._budgets: Dict[str, int] = {}
+        self._tenants: OrderedDict = OrderedDict()
+        self._memory: Dict[str, int] = {}
+        self._last_check: Dict[str, float] = {}
+        self._site_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+    
+    def _count(self, site: str, outcome: str):
+        counts = self._stats.setdefault(site, {'builds': 0, 'trims': 0, 'evictions': 0})
+        counts[outcome] += 1
+    
+    def budget(self, site: str) -> int:
+        return self._budgets.get(site, self.tenant_budget_bytes)
+    
+    def set_budget(self, site: str, budget_bytes: int):
+        """Give one site its own memory budget instead of the per-tenant default"""
+        self._budgets[site] = budget_bytes
+    
+    def get(self, site: Optional[str] = None) -> NXSServices:
+        """The site's services, built on first use and rebuilt when its specs change"""
+        site = site or PlatformConfig.DEFAULT_SITE
+        version = NXSSpecRegistry.get(site).version
+        with self._lock:
+            services = self._tenants.get(site)
+            site_lock = self._site_locks.setdefault(site, threading.Lock())
+        
+        if services is None or services.spec_version != version:
+            # Build under the site's lock so concurrent sessions share one build, without blocking other sites
+            with site_lock:
+                with self._lock:
+                    services = self._tenants.get(site)
+                if services is None or services.spec_version != version:
+                    services = _build_nxs_services(site)
+                    with self._lock:
+                        self._tenants[site] = services
+                        self._last_check.pop(site, None)
+                        self._count(site, 'builds')
+        
+        with self._lock:
+            if site in self._tenants:
+                self._tenants.move_to_end(site)
+            due = time.monotonic() - self._last_check.get(site, float('-inf')) >= self.check_interval
+        if due:
+            self.enforce(site)
+        return services
+    
+    def _trim(self, site: str, services: NXSServices) -> int:
+        """Shrink one tenant toward its budget; returns its memory afterwards"""
+        memory = estimate_memory(services)
+        trimmed = memory > self.budget(site)
+        if trimmed:
+            services.ai_engine.ai_modules.unload_idle(idle_seconds=0)
+            memory = estimate_memory(services)
+        if memory > self.budget(site):
+            services.ai_engine.forecast_cache.invalidate()
+            if services.ai_engine.pricing_optimizer is not None:
+                services.ai_engine.pricing_optimizer.invalidate()
+            memory = estimate_memory(services)
+        with self._lock:
+            if trimmed:
+                self._count(site, 'trims')
+            if site in self._tenants:
+                self._memory[site] = memory
+        return memory
+    
+    def _over_total(self) -> bool:
+        # Called with the lock held
+        return sum(self._memory.get(tenant, 0) for tenant in self._tenants) > self.total_budget_bytes
+    
+    def _evict(self, site: str):
+        # Called with the lock held
+        if self._tenants.pop(site, None) is not None:
+            self._memory.pop(site, None)
+            self._count(site, 'evictions')
+    
+    def enforce(self, site: str):
+        """Trim site to its budget; while over the total budget, evict tenants over their own budget
+        (the requesting one first), and only then least recently used tenants within theirs"""
+        with self._lock:
+            services = self._tenants.get(site)
+            self._last_check[site] = time.monotonic()
+        if services is None:
+            return
+        self._trim(site, services)
+        
+        with self._lock:
+            if not self._over_total():
+                return
+            over_budget = [tenant for tenant in self._tenants
+                           if tenant != site and self._memory.get(tenant, 0) > self.budget(tenant)]
+        # Sizes of other tenants were measured at their last check; shrink them before deciding
+        for tenant in over_budget:
+            with self._lock:
+                other = self._tenants.get(tenant)
+            if other is not None:
+                self._trim(tenant, other)
+        
+        with self._lock:
+            for tenant in [site] + over_budget:
+                if not self._over_total():
+                    return
+                if self._memory.get(tenant, 0) > self.budget(tenant):
+                    # The requesting session keeps its reference; the site rebuilds on its next request
+                    self._evict(tenant)
+            for tenant in list(self._tenants):
+                if not self._over_total():
+                    return
+                if tenant != site:
+                    self._evict(tenant)
+    
+    def invalidate(self, site: Optional[str] = None):
+        """Drop one site's services, or every site's; they rebuild on next request"""
+        with self._lock:
+            for tenant in [tenant for tenant in self._tenants if site is None or tenant == site]:
+                del self._tenants[tenant]
+                self._memory.pop(tenant, None)
+    
+    def sites(self) -> List[str]:
+        with self._lock:
+            return list(self._tenants)
+    
+    def status(self) -> List[Dict[str, Any]]:
+        """Per-tenant memory against budget, last build and lifetime counts"""
+        with self._lock:
+            return [
+                {
+                    'site': site,
+                    'memory_mb': round(self._memory.get(site, 0) / 2 ** 20, 2),
+                    'budget_mb': round(self.budget(site) / 2 ** 20, 2),
+                    'spec_version': services.spec_version[:8],
+                    'built_at': services.built_at.strftime('%H:%M:%S'),
+                    'loaded_modules': len(services.ai_engine.ai_modules.loaded()),
+                    **self._stats.get(site, {})
+                }
+                for site, services in self._tenants.items()
+            ]
+
+@st.cache_resource
+def get_nxs_tenant_pool() -> NXSTenantPool:
+    """The process-wide tenant pool; st.cache_resource creates it once per process"""
+    return NXSTenantPool(PlatformConfig.TENANT_MEMORY_BUDGET_MB * 2 ** 20, PlatformConfig.MEMORY_BUDGET_MB * 2 ** 20)
+
+def get_nxs_services(site: Optional[str] = None) -> NXSServices:
+    """Shared services for a site (the default site when omitted), built on first use"""
+    return get_nxs_tenant_pool().get(site)
+
+def invalidate_nxs_services(site: Optional[str] = None):
+    """Drop one site's shared services, or all of them; the next rerun rebuilds them"""
+    get_nxs_tenant_pool().invalidate(site)
+
+def refresh_nxs_data(*collections: str, site: Optional[str] = None):
+    """Rebuild a site's data store collections in place without rebuilding its AI services"""
+    services = get_nxs_services(site)
+    services.data_manager.refresh(*collections)
+    if not collections or {"nxs_bookings", "nxs_revenue"} & set(collections):
+        if services.demand_model.update_from(services.data_manager, demand_model_path(services.site)):
+            services.ai_engine.forecast_cache.invalidate('demand_predictions')
+
 # =============================================================================
 # MAIN NXS SPORTAI ENTERPRISE DASHBOARD
 # =============================================================================
@@ -1204,12 +3295,14 @@ class NXSDataManager:
 class NXSSportAIEnterpriseDashboard:
     """Main NXS SportAI Enterprise Dashboard with complete integration"""
     
-    def __init__(self, license_info: LicenseInfo):
+    def __init__(self, license_info: LicenseInfo, services: Optional[NXSServices] = None):
+        # Per-user state lives on the session; services are shared across sessions
         self.license_info = license_info
-        self.nxs_specs = NXSComplexSpecifications.get_facility_specs()
-        self.data_manager = NXSDataManager()
-        self.ai_engine = IntegratedAIEngine()
-        self.sponsorship_ai = NXSSponsorshipAI()
+        self.services = services or get_nxs_services()
+        self.nxs_specs = self.services.nxs_specs
+        self.data_manager = self.services.data_manager
+        self.ai_engine = self.services.ai_engine
+        self.sponsorship_ai = self.services.sponsorship_ai
         
     def render_main_interface(self):
         """Render the complete NXS SportAI Enterprise interface"""
@@ -1372,6 +3465,7 @@ class NXSSportAIEnterpriseDashboard:
             # Logout
             if st.sidebar.button("🚪 Logout"):
                 st.session_state.authenticated = False
+                st.session_state.pop("license_info", None)
                 st.rerun()
             
             selected_module = st.sidebar.selectbox("🧭 Navigate NXS SportAI Platform", nxs_modules)
@@ -1410,6 +3504,17 @@ class NXSSportAIEnterpriseDashboard:
         </div>
         """, unsafe_allow_html=True)
         
+        # Shared services
+        sites = NXSSpecRegistry.available_sites()
+        if len(sites) > 1:
+            st.sidebar.selectbox("🏟️ Site", sites, index=sites.index(self.services.site), key="nxs_site")
+        st.sidebar.caption(f"{self.services.site} services built {self.services.built_at:%H:%M:%S} in "
+                           f"{self.services.build_seconds * 1000:.0f} ms · specs {self.services.spec_version[:8]}")
+        if st.sidebar.button("🔄 Reload Platform Data"):
+            NXSSpecRegistry.reload(self.services.site)
+            invalidate_nxs_services(self.services.site)
+            st.rerun()
+        
         # License info
         st.sidebar.markdown("### 📋 License Information")
         features = self._get_license_features()
@@ -2734,13 +4839,31 @@ def render_nxs_ai_command_center(dashboard):
                 </div>
                 """, unsafe_allow_html=True)
     
+    with st.expander("🧩 AI Module Registry & Forecast Cache"):
+        registry = dashboard.ai_engine.ai_modules
+        st.caption(f"{len(registry.loaded())} of {len(registry)} modules loaded; idle modules unload after {registry.idle_seconds / 60:.0f} minutes")
+        st.dataframe(pd.DataFrame(registry.status()), use_container_width=True, hide_index=True)
+        if st.button("🧹 Unload Modules"):
+            unloaded = registry.unload_idle(idle_seconds=0)
+            st.success(f"Unloaded {len(unloaded)} modules")
+        
+        cache = dashboard.ai_engine.forecast_cache
+        st.caption(f"Forecast cache: {cache.hit_rate():.0%} hit rate, {cache.bucket_seconds // 60}-minute buckets")
+        if cache.stats():
+            st.dataframe(pd.DataFrame(cache.stats()), use_container_width=True, hide_index=True)
+        
+        pool = get_nxs_tenant_pool()
+        st.caption(f"Sites in memory: {len(pool.sites())}; {PlatformConfig.TENANT_MEMORY_BUDGET_MB} MB per site, "
+                   f"{PlatformConfig.MEMORY_BUDGET_MB} MB per process")
+        st.dataframe(pd.DataFrame(pool.status()), use_container_width=True, hide_index=True)
+    
     # Real-time AI insights
     tab1, tab2, tab3, tab4 = st.tabs(["🔮 Predictions", "⚡ Real-time Alerts", "📊 Performance", "🎯 Optimizations"])
     
     with tab1:
         st.markdown("### 🔮 AI Predictions for NXS Complex")
         
-        predictions = dashboard.ai_engine._generate_nxs_demand_predictions()
+        predictions = dashboard.ai_engine.get_demand_predictions()
         
         # Group predictions by facility
         facility_predictions = {}
@@ -2861,7 +4984,7 @@ def render_nxs_ai_command_center(dashboard):
     with tab4:
         st.markdown("### 🎯 AI Optimization Recommendations")
         
-        optimizations = dashboard.ai_engine._generate_nxs_optimizations()
+        optimizations = dashboard.ai_engine.get_optimizations()
         
         for opt in optimizations:
             priority_color = {'high': '#dc3545', 'medium': '#ffc107', 'low': '#28a745'}.get(opt.get('priority', 'medium'), '#ffc107')
@@ -2890,7 +5013,64 @@ def add_ai_methods_to_dashboard():
     
     def _render_tournament_ai(self):
         st.markdown("## 🏆 Tournament Management AI")
-        st.info("🚧 Advanced tournament AI module - Full implementation available in next update")
+        
+        st.markdown("### 📅 Weekend Tournament Scheduler")
+        next_saturday = datetime.now().date() + timedelta(days=(5 - datetime.now().weekday()) % 7)
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input("First Day", value=next_saturday)
+        with col2:
+            days = st.number_input("Days", min_value=1, max_value=4, value=2)
+        
+        default_teams = {"Soccer 7v7": 48, "Basketball": 48, "Volleyball": 16, "Lacrosse": 16}
+        columns = st.columns(len(TournamentScheduler.SPORTS))
+        divisions = []
+        for column, sport in zip(columns, TournamentScheduler.SPORTS):
+            with column:
+                teams = st.number_input(f"{sport} Teams", min_value=0, max_value=128, step=4,
+                                        value=default_teams.get(sport, 0), key=f"tournament_teams_{sport}")
+            if teams >= 2:
+                divisions.append(TournamentDivision(f"{sport} Division", sport, int(teams)))
+        
+        if st.button("🏆 Generate Schedule", disabled=not divisions):
+            matcher = self.ai_engine.ai_modules['tournament_matcher']
+            with st.spinner("Scheduling matches..."):
+                st.session_state[f"tournament_schedule_{self.services.site}"] = matcher.schedule_divisions(
+                    divisions, datetime.combine(start_date, datetime.min.time()), int(days))
+        
+        result = st.session_state.get(f"tournament_schedule_{self.services.site}")
+        if result is None:
+            return
+        quality = result.quality
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Matches Scheduled", f"{quality['matches_scheduled']}/{quality['matches_total']}",
+                      f"{quality['teams']} teams", delta_color="off")
+        with col2:
+            st.metric("Avg Team Idle Time", f"{quality['avg_team_idle_minutes']:.0f} min",
+                      f"max {quality['max_team_idle_minutes']} min", delta_color="off")
+        with col3:
+            gap = quality['gap_to_lower_bound']
+            st.metric("Playing Time Used", f"{quality['makespan_minutes'] / 60:.1f} h",
+                      f"{gap:+.0%} vs lower bound" if gap is not None else None, delta_color="inverse")
+        with col4:
+            st.metric("Solve Time", f"{quality['solve_seconds']:.1f} s",
+                      f"local search {quality['local_search_improvement']:.1%} better", delta_color="off")
+        
+        if result.unscheduled:
+            st.warning(f"{len(result.unscheduled)} matches did not fit - add a day or reduce the field")
+            st.dataframe(pd.DataFrame(result.unscheduled), use_container_width=True, hide_index=True)
+        
+        schedule = result.to_frame()
+        if not schedule.empty:
+            venue = st.selectbox("Venue", ["All venues"] + sorted(schedule['venue'].unique()))
+            if venue != "All venues":
+                schedule = schedule[schedule['venue'] == venue]
+            st.dataframe(schedule, use_container_width=True, hide_index=True)
+        
+        with st.expander("Solution quality"):
+            st.json(quality)
     
     def _render_nil_compliance_ai(self):
         st.markdown("## 💼 NIL Compliance AI")
@@ -2898,7 +5078,33 @@ def add_ai_methods_to_dashboard():
     
     def _render_predictive_analytics(self):
         st.markdown("## 🔮 Predictive Analytics")
-        st.info("🚧 Advanced predictive analytics - Full implementation available in next update")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            horizon_days = st.slider("Forecast Horizon (days)", 1, 90, 14)
+        with col2:
+            step_minutes = st.selectbox("Resolution", DemandForecastEngine.STEP_MINUTES, index=2,
+                                        format_func=lambda minutes: f"{minutes} minutes")
+        
+        forecast = self.ai_engine.get_demand_forecast(hours=horizon_days * 24, step_minutes=step_minutes)
+        facilities = st.multiselect("Facilities", list(forecast.facilities), default=list(forecast.facilities[:3]))
+        if not facilities:
+            st.info("Select at least one facility")
+            return
+        rows = [forecast.facility_index(facility) for facility in facilities]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Avg Occupancy", f"{forecast.occupancy[rows].mean():.1%}")
+        with col2:
+            st.metric("Peak Occupancy", f"{forecast.occupancy[rows].max():.1%}")
+        with col3:
+            st.metric("Revenue Potential", f"${forecast.revenue_potential[rows].sum():,.0f}")
+        with col4:
+            st.metric("Avg Confidence", f"{forecast.confidence[rows].mean():.0%}")
+        
+        occupancy = pd.DataFrame(forecast.occupancy[rows].T, index=forecast.timestamps, columns=facilities)
+        st.line_chart(occupancy)
     
     def _render_biometric_analysis(self):
         st.markdown("## 📊 Biometric Analysis")
@@ -2934,7 +5140,77 @@ def add_ai_methods_to_dashboard():
     
     def _render_revenue_sponsorship_management(self):
         st.markdown("## 💰 Revenue & Sponsorship Management")
-        st.info("🚧 Complete revenue/sponsorship management - Full implementation available in next update")
+        
+        tab1, tab2 = st.tabs(["📈 Dynamic Pricing", "💎 Sponsorship ROI"])
+        with tab1:
+            render_dynamic_pricing(self)
+        with tab2:
+            render_sponsorship_roi(self)
+    
+    def render_sponsorship_roi(dashboard):
+        st.markdown("### 💎 Sponsorship ROI Explorer")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            points = st.slider("Price Points per Package", 5, 101, 21)
+        with col2:
+            uncertainty = st.slider("Value Uncertainty (±)", 0.0, 0.5, 0.25, 0.05, format="%.2f")
+        with col3:
+            band = st.selectbox("Sensitivity Band", [(0.1, 0.9), (0.05, 0.95), (0.25, 0.75)],
+                                format_func=lambda band: f"P{band[0] * 100:.0f}-P{band[1] * 100:.0f}")
+        
+        surface = dashboard.sponsorship_ai.evaluate_roi_surface(points=points, uncertainty=uncertainty, band=band)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Equivalent Advertising Value", f"${surface.equivalent_value:,.0f}")
+        with col2:
+            st.metric("Annual Impressions", f"{surface.annual_impressions:,.0f}")
+        with col3:
+            st.metric("Package Price Points", f"{surface.investments.size:,}")
+        with col4:
+            st.metric("Solve Time", f"{surface.solve_seconds * 1000:.1f} ms")
+        
+        st.dataframe(surface.summary(), use_container_width=True, hide_index=True)
+        
+        option = st.selectbox("Package", surface.options, format_func=lambda option: surface.names[surface.option_index(option)])
+        detail = surface.to_frame([option])
+        st.line_chart(detail.set_index('investment')[['roi_low', 'roi_percentage', 'roi_high']])
+        st.dataframe(detail.drop(columns=['option', 'name']), use_container_width=True, hide_index=True)
+    
+    def render_dynamic_pricing(dashboard):
+        st.markdown("### 📈 Dynamic Pricing Optimizer")
+        optimizer = dashboard.ai_engine.pricing_optimizer
+        if optimizer is None:
+            st.info("Dynamic pricing needs the fitted NXS demand model")
+            return
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            week = st.date_input("Pricing Week", value=datetime.now().date())
+        with col2:
+            if st.button("🔄 Re-optimize Prices"):
+                optimizer.invalidate()
+        
+        plan = optimizer.optimize(datetime.combine(week, datetime.min.time()))
+        summary = plan.summary()
+        current = summary['weekly_revenue_current'].sum()
+        optimized = summary['weekly_revenue_optimized'].sum()
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Weekly Revenue (Current Rates)", f"${current:,.0f}")
+        with col2:
+            st.metric("Weekly Revenue (Optimized)", f"${optimized:,.0f}", f"{optimized / current - 1:+.1%}" if current else None)
+        with col3:
+            st.metric("Facility-Hours Priced", f"{plan.prices.size:,}")
+        with col4:
+            st.metric("Solve Time", f"{plan.solve_seconds * 1000:.0f} ms")
+        
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+        
+        facility_id = st.selectbox("Hourly Schedule", plan.facility_ids)
+        st.line_chart(plan.schedule(facility_id)[['current_rate', 'optimized_rate']])
     
     def _render_api_integration_hub(self):
         st.markdown("## 🔌 API & Integration Hub")
@@ -2981,7 +5257,7 @@ def main():
         
         # Load main application
         license_info = st.session_state.license_info
-        dashboard = NXSSportAIEnterpriseDashboard(license_info)
+        dashboard = NXSSportAIEnterpriseDashboard(license_info, get_nxs_services(st.session_state.get('nxs_site')))
         dashboard.render_main_interface()
         
     except Exception as e:
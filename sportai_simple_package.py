@@ -27,51 +27,232 @@ def create_simple_package():
 
 import sqlite3
 import hashlib
+import json
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
 try:
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Request, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
     import uvicorn
 except ImportError:
     print("Installing FastAPI...")
     import subprocess, sys
     subprocess.check_call([sys.executable, "-m", "pip", "install", "fastapi", "uvicorn[standard]"])
-    from fastapi import FastAPI, HTTPException
+    from fastapi import FastAPI, HTTPException, Request, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
     import uvicorn
 
+# Response cache: route -> (body, etag, expires_at); TTLs in seconds
+CACHE_TTLS = {"facilities": 30, "insights": 300}
+_cache = {}
+# Bumped on invalidation; a load that started before a write must not store its stale body
+_cache_generations = {route: 0 for route in CACHE_TTLS}
+_cache_lock = threading.Lock()
+
+def invalidate_cache(*routes):
+    """Drop cached responses (all routes when none given)"""
+    with _cache_lock:
+        for route in routes or list(CACHE_TTLS):
+            _cache_generations[route] = _cache_generations.get(route, 0) + 1
+            _cache.pop(route, None)
+
+def cached_json(request, route, loader):
+    """Serve route from cache with an ETag, answering If-None-Match with 304"""
+    with _cache_lock:
+        entry = _cache.get(route)
+        generation = _cache_generations.get(route, 0)
+    if not entry or entry[2] <= time.monotonic():
+        body = json.dumps(loader(), separators=(",", ":")).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        entry = (body, etag, time.monotonic() + CACHE_TTLS[route])
+        with _cache_lock:
+            if _cache_generations.get(route, 0) == generation:
+                _cache[route] = entry
+    
+    body, etag, _ = entry
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={CACHE_TTLS[route]}"}
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+class ConnectionManager:
+    """Small pool of shared SQLite connections plus a facilities snapshot dropped on write"""
+    
+    def __init__(self, path="sportai.db", size=4):
+        self.path = path
+        self.size = size
+        self._pool = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._facilities = None
+        self._version = 0
+    
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    
+    def open(self):
+        """Open every pooled connection up front so requests never pay for setup"""
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            self._pool.put(self._connect())
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        with self._lock:
+            create = self._pool.empty() and self._created < self.size
+            if create:
+                self._created += 1
+        conn = self._connect() if create else self._pool.get()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._pool.put(conn)
+    
+    @contextmanager
+    def write(self, *tables):
+        """Connection for writes to tables; cached reads of them are dropped after commit"""
+        with self.connection() as conn:
+            yield conn
+        self.invalidate(*tables)
+    
+    def invalidate(self, *tables):
+        if not tables or "facilities" in tables:
+            with self._lock:
+                self._facilities = None
+                self._version += 1
+            invalidate_cache("facilities")
+    
+    def facilities(self):
+        """Facilities as dicts, read once and reused until the next write"""
+        snapshot = self._facilities
+        if snapshot is not None:
+            return snapshot
+        
+        version = self._version
+        with self.connection() as conn:
+            rows = conn.execute("SELECT id, name, type, capacity, utilization, revenue, status FROM facilities").fetchall()
+        snapshot = [
+            {"id": row[0], "name": row[1], "type": row[2],
+             "capacity": row[3], "utilization": row[4], "revenue": row[5], "status": row[6]}
+            for row in rows
+        ]
+        with self._lock:
+            # A write that landed while we were reading makes this snapshot stale
+            if version == self._version:
+                self._facilities = snapshot
+        return snapshot
+    
+    def close(self):
+        """Close every pooled connection"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+db = ConnectionManager("sportai.db")
+
 # Initialize database
 def init_db():
-    conn = sqlite3.connect("sportai.db")
-    conn.execute("""CREATE TABLE IF NOT EXISTS facilities (
-        id INTEGER PRIMARY KEY, name TEXT, type TEXT, capacity INTEGER, 
-        utilization REAL, revenue REAL, status TEXT)""")
-    
-    conn.execute("""CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY, email TEXT UNIQUE, password_hash TEXT, role TEXT)""")
-    
-    # Insert sample data
-    conn.execute("DELETE FROM facilities")
-    facilities = [
-        ("Basketball Court 1", "Indoor", 200, 89.0, 9450.0, "active"),
-        ("Main Dome", "Multi-Sport", 500, 93.0, 15200.0, "active"),
-        ("Tennis Court", "Outdoor", 50, 78.0, 4800.0, "active")
-    ]
-    conn.executemany("INSERT INTO facilities (name, type, capacity, utilization, revenue, status) VALUES (?, ?, ?, ?, ?, ?)", facilities)
-    
-    # Create admin user
-    admin_hash = hashlib.sha256("admin123".encode()).hexdigest()
-    conn.execute("INSERT OR REPLACE INTO users (email, password_hash, role) VALUES (?, ?, ?)", 
-                ("admin@sportai.com", admin_hash, "admin"))
-    conn.commit()
-    conn.close()
+    with db.write("facilities", "users") as conn:
+        conn.execute("""CREATE TABLE IF NOT EXISTS facilities (
+            id INTEGER PRIMARY KEY, name TEXT, type TEXT, capacity INTEGER, 
+            utilization REAL, revenue REAL, status TEXT)""")
+        
+        conn.execute("""CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY, email TEXT UNIQUE, password_hash TEXT, role TEXT)""")
+        
+        # Insert sample data
+        conn.execute("DELETE FROM facilities")
+        facilities = [
+            ("Basketball Court 1", "Indoor", 200, 89.0, 9450.0, "active"),
+            ("Main Dome", "Multi-Sport", 500, 93.0, 15200.0, "active"),
+            ("Tennis Court", "Outdoor", 50, 78.0, 4800.0, "active")
+        ]
+        conn.executemany("INSERT INTO facilities (name, type, capacity, utilization, revenue, status) VALUES (?, ?, ?, ?, ?, ?)", facilities)
+        
+        # Create admin user
+        admin_hash = hashlib.sha256("admin123".encode()).hexdigest()
+        conn.execute("INSERT OR REPLACE INTO users (email, password_hash, role) VALUES (?, ?, ?)", 
+                    ("admin@sportai.com", admin_hash, "admin"))
     print("✅ Database initialized")
 
+@asynccontextmanager
+async def lifespan(app):
+    db.open()
+    yield
+    db.close()
+
 # Create FastAPI app
-app = FastAPI(title="SportAI Enterprise Suite™", version="6.0.0")
+app = FastAPI(title="SportAI Enterprise Suite™", version="6.0.0", lifespan=lifespan)
+
+# Admission control: per-client token bucket and a bounded in-flight count;
+# requests sent with "X-Priority: bulk" get a small separate cap so dashboards keep headroom
+RATE_PER_SECOND, RATE_BURST = 20.0, 60
+MAX_IN_FLIGHT, BULK_MAX_IN_FLIGHT = 16, 2
+_buckets = {}
+admission_stats = {"in_flight": 0, "bulk_in_flight": 0, "admitted": 0, "rate_limited": 0, "shed": 0}
+
+@app.middleware("http")
+async def admission_control(request: Request, call_next):
+    if not request.url.path.startswith("/api"):
+        return await call_next(request)
+    
+    client = request.client.host if request.client else "unknown"
+    now = time.monotonic()
+    tokens, updated = _buckets.get(client, (RATE_BURST, now))
+    tokens = min(RATE_BURST, tokens + (now - updated) * RATE_PER_SECOND)
+    if len(_buckets) > 10000:
+        _buckets.clear()
+    if tokens < 1:
+        _buckets[client] = (tokens, now)
+        admission_stats["rate_limited"] += 1
+        return JSONResponse({"detail": "Rate limit exceeded"}, status_code=429, headers={"Retry-After": "1"})
+    _buckets[client] = (tokens - 1, now)
+    
+    bulk = request.headers.get("x-priority", "").lower() == "bulk"
+    if admission_stats["in_flight"] >= MAX_IN_FLIGHT or (bulk and admission_stats["bulk_in_flight"] >= BULK_MAX_IN_FLIGHT):
+        admission_stats["shed"] += 1
+        return JSONResponse({"detail": "Server busy, retry shortly"}, status_code=503, headers={"Retry-After": "1"})
+    
+    lane = "bulk_in_flight" if bulk else None
+    admission_stats["in_flight"] += 1
+    admission_stats["admitted"] += 1
+    if lane:
+        admission_stats[lane] += 1
+    try:
+        return await call_next(request)
+    finally:
+        admission_stats["in_flight"] -= 1
+        if lane:
+            admission_stats[lane] -= 1
 
+# Added after admission control so it wraps it: 429/503 responses carry CORS headers too
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
+@app.get("/api/metrics/admission")
+def admission_metrics():
+    return {**admission_stats, "tracked_clients": len(_buckets)}
+
 @app.get("/")
 def root():
     return {"message": "SportAI Enterprise Suite™", "docs": "/docs"}
@@ -82,31 +263,19 @@ def health():
 
 @app.post("/api/auth/login")
 def login(email: str, password: str):
-    conn = sqlite3.connect("sportai.db")
     password_hash = hashlib.sha256(password.encode()).hexdigest()
-    cursor = conn.execute("SELECT * FROM users WHERE email=? AND password_hash=?", (email, password_hash))
-    user = cursor.fetchone()
-    conn.close()
+    with db.connection() as conn:
+        user = conn.execute("SELECT * FROM users WHERE email=? AND password_hash=?", (email, password_hash)).fetchone()
     
     if user:
         return {"user": {"email": email, "role": user[3]}, "access_token": "demo-token", "token_type": "bearer"}
     raise HTTPException(status_code=401, detail="Invalid credentials")
 
 @app.get("/api/facilities")
-def get_facilities():
-    conn = sqlite3.connect("sportai.db")
-    cursor = conn.execute("SELECT * FROM facilities")
-    facilities = []
-    for row in cursor.fetchall():
-        facilities.append({
-            "id": row[0], "name": row[1], "type": row[2], 
-            "capacity": row[3], "utilization": row[4], "revenue": row[5], "status": row[6]
-        })
-    conn.close()
-    return facilities
+def get_facilities(request: Request):
+    return cached_json(request, "facilities", db.facilities)
 
-@app.get("/api/analytics/insights")
-def get_insights():
+def load_insights():
     return [
         {"type": "opportunity", "title": "Utilization Optimization", 
          "description": "Average facility utilization is 87%. Dynamic pricing could increase revenue by 15-25%.", 
@@ -116,6 +285,10 @@ def get_insights():
          "priority": "medium"}
     ]
 
+@app.get("/api/analytics/insights")
+def get_insights(request: Request):
+    return cached_json(request, "insights", load_insights)
+
 if __name__ == "__main__":
     init_db()
     print("🚀 Starting SportAI Enterprise Suite™")
@@ -137,6 +310,7 @@ if __name__ == "__main__":
 import streamlit as st
 import sqlite3
 import hashlib
+import threading
 import pandas as pd
 
 st.set_page_config(page_title="SportAI Enterprise Suite™", page_icon="🏟️", layout="wide")
@@ -145,12 +319,23 @@ def init_session():
     if 'authenticated' not in st.session_state:
         st.session_state.authenticated = False
 
+@st.cache_resource
+def get_facilities_cache():
+    """One connection and facilities snapshot shared by every session and rerun"""
+    return {"conn": sqlite3.connect("sportai.db", check_same_thread=False),
+            "lock": threading.Lock(), "data_version": None, "facilities": pd.DataFrame()}
+
 def get_db_data():
+    """Facilities table, re-read only after another process has written to the database"""
+    cache = get_facilities_cache()
     try:
-        conn = sqlite3.connect("sportai.db")
-        facilities = pd.read_sql("SELECT * FROM facilities", conn)
-        conn.close()
-        return facilities
+        with cache["lock"]:
+            # data_version changes whenever another connection (e.g. main.py) commits
+            data_version = cache["conn"].execute("PRAGMA data_version").fetchone()[0]
+            if data_version != cache["data_version"] or cache["facilities"].empty:
+                cache["facilities"] = pd.read_sql("SELECT * FROM facilities", cache["conn"])
+                cache["data_version"] = data_version
+            return cache["facilities"]
     except:
         return pd.DataFrame()
 